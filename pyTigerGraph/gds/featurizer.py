@@ -8,15 +8,91 @@ if TYPE_CHECKING:
     from ..pyTigerGraph import TigerGraphConnection
 
 from ..pyTigerGraphException import TigerGraphException
+import asyncio
 import json
 import re
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from os.path import join as pjoin
+from types import MappingProxyType
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .utilities import is_query_installed, random_string
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Query name in the first line of a query file, e.g. `CREATE QUERY tg_pagerank (`.
+_QUERY_NAME_RE = re.compile(r"QUERY (.+?)\(")
+# "<type> <name> [= <default>]" entries of a query header, e.g. `SET<STRING> v_type` or
+# `STRING wt_attr = "weight"`. Quoted defaults may contain commas.
+_PARAM_RE = re.compile(
+    r"""(\w+(?:\s*<[^()]*?>)?)\s+(\w+)\s*(?:=\s*("[^"]*"|'[^']*'|[^,]*?))?\s*(?:,|$)"""
+)
+# Lower-cased GSQL type -> (reported type, converter for the default value).
+_PARAM_TYPES = {
+    "float": ("float", float),
+    "double": ("float", float),
+    "int": ("int", int),
+    "bool": ("bool", lambda v: {"true": True, "false": False}.get(v.lower())),
+    "string": ("str", lambda v: v.strip('"').strip("'")),
+}
+
+# Shared by the manifest and query downloads so HTTPS connections are reused.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+
+
+@lru_cache(maxsize=None)
+def _fetch_query(url: str) -> str:
+    # Queries in the algorithm library are immutable per release, so each URL is fetched once.
+    resp = _session.get(url, timeout=30)
+    resp.raise_for_status()
+    return resp.text
+
+
+def _freeze(d: dict) -> Mapping:
+    # Read-only view of a nested dict, safe to share between Featurizer instances.
+    return MappingProxyType(
+        {k: _freeze(v) if isinstance(v, dict) else v for k, v in d.items()}
+    )
+
+
+def _native(value):
+    # NumPy scalars and arrays serialize differently from plain Python values.
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, list):
+        return [_native(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_native(v) for v in value)
+    if isinstance(value, dict):
+        return {_native(k): _native(v) for k, v in value.items()}
+    return value
+
+
+def _normalize_params(params: dict) -> dict:
+    # Same parameters, same payload: sorted keys and plain Python values.
+    return {k: _native(params[k]) for k in sorted(params)}
+
+
+def _read_query(query_path: str) -> str:
+    if query_path.startswith("http"):
+        return _fetch_query(query_path)
+    # Local files are read every time since custom queries may be edited between installs.
+    with open(query_path) as f:
+        return f.read()
+
 
 class AsyncFeaturizerResult():
     def __init__(self, conn, algorithm, query_id, results=None):
@@ -44,6 +120,29 @@ class AsyncFeaturizerResult():
             time.sleep(refresh)
         return self.results
 
+    async def waitAsync(self, refresh: float = 1):
+        """
+        Coroutine that waits for the algorithm result without blocking the event loop.
+        Awaiting the `AsyncFeaturizerResult` object itself is equivalent, so several
+        algorithms started with `runAsync=True` can be collected with `asyncio.gather()`.
+        Args:
+            refresh (float):
+                How often to check for results. Defaults to 1 time every second.
+
+        Returns:
+            Algorithm results when they become available.
+        """
+        loop = asyncio.get_running_loop()
+        while not(self.results):
+            # Status checks are blocking HTTP calls, so run them off the event loop.
+            if await loop.run_in_executor(None, self.algorithmComplete):
+                return await loop.run_in_executor(None, self._getAlgorithmResults)
+            await asyncio.sleep(refresh)
+        return self.results
+
+    def __await__(self):
+        return self.waitAsync().__await__()
+
     def algorithmComplete(self):
         """
         Function to check if the algorithm has completed execution.
@@ -84,6 +183,11 @@ class AsyncFeaturizerResult():
                 return "Algorithm Results not Available Yet"
 
 class Featurizer:
+    # Parsed manifests keyed by path/URL, shared by all instances in the process.
+    _algo_dict_cache = {}
+    # Algorithm paths, result types and schema types keyed by repo.
+    _algo_details_cache = {}
+
     def __init__(
         self, conn: "TigerGraphConnection", repo: str = None, algo_version: str = None
     ):
@@ -114,10 +218,13 @@ class Featurizer:
         self.repo = repo
         # Get algo dict from manifest
         manifest = pjoin(repo, "manifest.json")
-        self.algo_dict = self._get_algo_dict(manifest)
+        self.algo_dict = self._load_algo_dict(manifest)
         self.algo_paths = None
 
-        self.params_dict = {}  # input parameter for the desired algorithm to be run
+        self.params_dict = {}  # parsed (values, types) of the parameters per algorithm
+        self._required_params = {}  # parameters without a default value per algorithm
+        self._installed_queries = set()  # queries known to be installed and enabled
+        self._added_attrs = set()  # result attributes this featurizer has already added
         self.query = None
         self.query_name = None
         self.query_result_type = None
@@ -133,15 +240,23 @@ class Featurizer:
             minor_ver = "7"
         return major_ver, minor_ver, patch_ver
 
+    def _load_algo_dict(self, manifest_file: str) -> dict:
+        # The manifest only changes between library releases, so fetch and parse it once.
+        if manifest_file not in Featurizer._algo_dict_cache:
+            Featurizer._algo_dict_cache[manifest_file] = _freeze(self._get_algo_dict(manifest_file))
+        return Featurizer._algo_dict_cache[manifest_file]
+
     def _get_algo_dict(self, manifest_file: str) -> dict:
         # Get algo dict from manifest
         if manifest_file.startswith("http"):
-            resp = requests.get(manifest_file)
+            resp = _session.get(manifest_file, timeout=30)
             resp.raise_for_status()
-            algo_dict = resp.json()
+            content = resp.content
         else:
-            with open(manifest_file) as infile:
-                algo_dict = json.load(infile)
+            with open(manifest_file, "rb") as infile:
+                content = infile.read()
+        # orjson is an optional, faster drop-in for decoding.
+        algo_dict = orjson.loads(content) if orjson else json.loads(content)
         return algo_dict
 
     def listAlgorithms(self, category: str = None) -> None:
@@ -154,39 +269,43 @@ class Featurizer:
         """
 
         def get_num_algos(algo_dict: dict) -> int:
-            if "name" in algo_dict.keys():
-                return 1
             num_algos = 0
-            for k in algo_dict:
-                if isinstance(algo_dict[k], dict):
-                    num_algos += get_num_algos(algo_dict[k])
+            stack = [algo_dict]
+            while stack:
+                d = stack.pop()
+                if "name" in d:
+                    num_algos += 1
+                else:
+                    stack.extend(v for v in d.values() if isinstance(v, Mapping))
             return num_algos
 
-        def print_algos(algo_dict: dict, depth: int, algo_num: int = 0) -> int:
+        def format_algos(algo_dict: dict, depth: int, lines: list, algo_num: int = 0) -> int:
             for k, v in algo_dict.items():
                 if k == "name":
                     algo_num += 1
-                    print("{}{:02}. name: {}".format("  " * depth, algo_num, v))
+                    lines.append("{}{:02}. name: {}".format("  " * depth, algo_num, v))
                     return algo_num
-                if isinstance(v, dict):
-                    print("{}{}:".format("  " * depth, k))
-                    algo_num = print_algos(v, depth + 1, algo_num)
+                if isinstance(v, Mapping):
+                    lines.append("{}{}:".format("  " * depth, k))
+                    algo_num = format_algos(v, depth + 1, lines, algo_num)
             return algo_num
 
+        # Collect the output and print it at once rather than line by line.
         if category:
-            if category in self.algo_dict.keys():
-                print("Available algorithms for {}:".format(category))
-                print_algos(self.algo_dict[category], 1)
-                print("Call runAlgorithm() with the algorithm name to execute it")
+            if category in self.algo_dict:
+                lines = ["Available algorithms for {}:".format(category)]
+                format_algos(self.algo_dict[category], 1, lines)
+                lines.append("Call runAlgorithm() with the algorithm name to execute it")
             else:
-                print("No available algorithms for category {}".format(category))
+                lines = ["No available algorithms for category {}".format(category)]
         else:
-            print("Available algorithms per category:")
+            lines = ["Available algorithms per category:"]
             for k in self.algo_dict:
-                print("- {}: {} algorithms".format(k, get_num_algos(self.algo_dict[k])))
-            print(
+                lines.append("- {}: {} algorithms".format(k, get_num_algos(self.algo_dict[k])))
+            lines.append(
                 "Call listAlgorithms() with the category name to see the list of algorithms"
             )
+        print("\n".join(lines))
 
     def _install_query_file(
         self,
@@ -211,22 +330,18 @@ class Featurizer:
             Name of the installed query
         """
         # Read in the query
-        if query_path.startswith("http"):
-            resp = requests.get(query_path)
-            resp.raise_for_status()
-            query = resp.text
-        else:
-            with open(query_path) as f:
-                query = f.read()
+        query = _read_query(query_path)
         # Get query name from the first line
-        firstline = query.split("\n", 1)[0]
+        firstline = query.partition("\n")[0]
         try:
-            query_name = re.search(r"QUERY (.+?)\(", firstline).group(1).strip()
-        except:
+            query_name = _QUERY_NAME_RE.search(firstline).group(1).strip()
+        except AttributeError:
             raise ValueError(
                 "Cannot parse the query file. It should start with CREATE QUERY ... "
             )
         # If query is already installed, skip unless force install.
+        if query_name in self._installed_queries and not force:
+            return query_name
         is_installed, is_enabled = is_query_installed(
             self.conn, query_name, return_status=True
         )
@@ -239,7 +354,9 @@ class Featurizer:
                 status = resp.splitlines()[-1]
                 if "Failed" in status:
                     raise ConnectionError(resp)
+                self._installed_queries.discard(query_name)
             else:
+                self._installed_queries.add(query_name)
                 return query_name
         # Replace placeholders with actual content if given
         if replace:
@@ -256,16 +373,15 @@ class Featurizer:
                 global_change=global_change,
             )
         # TODO: Check if Distributed query is needed.
-        query = (
-            "USE GRAPH {}\n".format(self.conn.graphname)
-            + query
-            + "\nInstall Query {}\n".format(query_name)
+        query = "USE GRAPH {}\n{}\nInstall Query {}\n".format(
+            self.conn.graphname, query, query_name
         )
         print("Installing and optimizing the queries, it might take a minute...", flush=True)
         resp = self.conn.gsql(query)
         status = resp.splitlines()[-1]
         if "Failed" in status:
             raise ConnectionError(resp)
+        self._installed_queries.add(query_name)
         print("Queries installed successfully", flush=True)
         return query_name
 
@@ -293,38 +409,74 @@ class Featurizer:
             self.query_name = self._install_query_file(query_path, global_change=global_change)
             return self.query_name
         # Else, install query by name from the repo.
-        # If the query paths are not collected yet, do it now.
-        if not self.algo_paths:
-            self.algo_paths, self.query_result_type, self.sch_type = self._get_algo_details(self.algo_dict)
-        if query_name not in self.algo_paths:
-            raise ValueError("Cannot find {} in the library.".format(query_name))
-        for query in self.algo_paths[query_name]:
+        for query in self._get_algo_paths(query_name):
             _ = self._install_query_file(query, global_change=global_change)
         self.query_name = query_name
         return self.query_name
 
-    def _get_algo_details(self, algo_dict: dict) -> dict:
-        def get_details(d: dict, paths: dict, types: dict, sch_obj: dict) -> None:
-            if "name" in d.keys():
-                if "path" not in d.keys():
-                    raise Exception(
-                        "Cannot find path for {} in the manifest file".format(d["name"])
-                    )
-                paths[d["name"]] = [pjoin(self.repo, p) for p in d["path"].split(";")]
-                if "value_type" in d.keys():
-                    types[d["name"]] = d["value_type"]
-                if "schema_type" in d.keys():
-                    sch_obj[d["name"]] = d["schema_type"]
-                return
-            for k in d:
-                if isinstance(d[k], dict):
-                    get_details(d[k], paths, types, sch_obj)
-            return
+    def installAlgorithms(
+        self, query_names: List[str], global_change: bool = False, max_workers: int = 8
+    ) -> List[str]:
+        """
+        Installs multiple algorithms from the library.
+        The query files of all algorithms are downloaded concurrently before the queries are installed one by one.
+
+        Args:
+            query_names (List[str]):
+                The names of the queries to be installed.
+            global_change (bool):
+                False by default. Set to true if you want to run `GLOBAL SCHEMA_CHANGE JOB`. For algorithms that are not schema free we need to specify this argument.
+                See https://docs.tigergraph.com/gsql-ref/current/ddl-and-loading/modifying-a-graph-schema#_global_vs_local_schema_changes.
+            max_workers (int):
+                Maximum number of concurrent downloads. Defaults to 8.
+        Returns:
+            List of query names installed.
+        """
+        # Resolve all names first so an unknown name fails before anything is installed.
+        paths = [p for query_name in query_names for p in self._get_algo_paths(query_name)]
+        # Warm the query cache in parallel; installation itself stays sequential.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_read_query, paths))
+        return [
+            self.installAlgorithm(query_name, global_change=global_change)
+            for query_name in query_names
+        ]
+
+    def _load_algo_details(self) -> None:
+        # Walk the manifest once per repo; afterwards every lookup is a dict access.
+        if not self.algo_paths:
+            if self.repo not in Featurizer._algo_details_cache:
+                Featurizer._algo_details_cache[self.repo] = self._get_algo_details(self.algo_dict)
+            self.algo_paths, self.query_result_type, self.sch_type = Featurizer._algo_details_cache[self.repo]
 
+    def _get_algo_paths(self, query_name: str) -> List[str]:
+        self._load_algo_details()
+        if query_name not in self.algo_paths:
+            raise ValueError(
+                "Cannot find {} in the library. Call listAlgorithms() to see the available algorithms.".format(query_name)
+            )
+        return self.algo_paths[query_name]
+
+    def _get_algo_details(self, algo_dict: dict) -> dict:
         algo_paths = {}
         algo_result_types = {}
         sch_types = {}
-        get_details(algo_dict, algo_paths, algo_result_types, sch_types)
+        # Walk the nested categories with an explicit stack; an algorithm is a dict with a name.
+        stack = [algo_dict]
+        while stack:
+            d = stack.pop()
+            if "name" not in d:
+                stack.extend(v for v in d.values() if isinstance(v, Mapping))
+                continue
+            if "path" not in d:
+                raise Exception(
+                    "Cannot find path for {} in the manifest file".format(d["name"])
+                )
+            algo_paths[d["name"]] = [pjoin(self.repo, p) for p in d["path"].split(";")]
+            if "value_type" in d:
+                algo_result_types[d["name"]] = d["value_type"]
+            if "schema_type" in d:
+                sch_types[d["name"]] = d["schema_type"]
         return algo_paths, algo_result_types, sch_types
 
     def _add_attribute(
@@ -353,35 +505,64 @@ class Featurizer:
                 See https://docs.tigergraph.com/gsql-ref/current/ddl-and-loading/modifying-a-graph-schema#_global_vs_local_schema_changes.
                 If the schema change should be global or local.
         """
-        # Check whether to add the attribute to vertex(vertices) or edge(s)
         self.result_attr = attr_name
-        v_type = False
+        return self._add_attributes(
+            schema_type, [(attr_name, attr_type)], schema_name, global_change
+        )
+
+    def _add_attributes(
+        self,
+        schema_type: str,
+        attrs: List[Tuple[str, str]],
+        schema_name: List[str] = None,
+        global_change: bool = False,
+    ):
+        """
+        Adds the attributes that are not already in the schema with a single schema change job.
+        All missing attributes of a vertex/edge type are added with one ALTER statement.
+
+        Args:
+            schema_type (str):
+                Vertex or edge
+            attrs (List[Tuple[str, str]]):
+                List of `(attr_name, attr_type)` pairs that need to be added to the vertex/edge
+            schema_name (List[str]):
+                List of Vertices/Edges that need the attributes added to them.
+            global_change (bool):
+                False by default. Set to true if you want to run `GLOBAL SCHEMA_CHANGE JOB`.
+                See https://docs.tigergraph.com/gsql-ref/current/ddl-and-loading/modifying-a-graph-schema#_global_vs_local_schema_changes.
+        """
+        # Check whether to add the attributes to vertex(vertices) or edge(s)
         if schema_type.upper() == "VERTEX":
-            target = self.conn.getVertexTypes(force=True)
             v_type = True
         elif schema_type.upper() == "EDGE":
-            target = self.conn.getEdgeTypes(force=True)
+            v_type = False
         else:
             raise Exception("schema_type has to be VERTEX or EDGE")
-        # If attribute should be added to a specific vertex/edge name
-        if schema_name != None:
-            target.clear()
-            target = schema_name
+        # A single schema fetch provides the attributes of every vertex or edge type
+        schema = self.conn.getSchema(force=True)
+        existing_attrs = {
+            st["Name"]: {a["AttributeName"] for a in st["Attributes"]}
+            for st in schema["VertexTypes" if v_type else "EdgeTypes"]
+        }
+        # If attributes should be added to a specific vertex/edge name
+        if schema_name is not None:
+            target = list(schema_name)
+        else:
+            target = list(existing_attrs)
         # For every vertex or edge type
         tasks = []
         for t in target:
-            attributes = []
-            if v_type:
-                meta_data = self.conn.getVertexType(t, force=True)
-            else:
-                meta_data = self.conn.getEdgeType(t, force=True)
-            for i in range(len(meta_data["Attributes"])):
-                attributes.append(meta_data["Attributes"][i]["AttributeName"])
-            # If attribute is not in list of vertex attributes, do the schema change to add it
-            if attr_name != None and attr_name not in attributes:
+            # Attributes that are not in list of vertex attributes need the schema change
+            missing = [
+                "{} {}".format(attr_name, attr_type)
+                for attr_name, attr_type in attrs
+                if attr_name is not None and attr_name not in existing_attrs.get(t, ())
+            ]
+            if missing:
                 tasks.append(
-                    "ALTER {} {} ADD ATTRIBUTE ({} {});\n".format(
-                        schema_type, t, attr_name, attr_type
+                    "ALTER {} {} ADD ATTRIBUTE ({});\n".format(
+                        schema_type, t, ", ".join(missing)
                     )
                 )
         # If attribute already exists for schema type t, nothing to do
@@ -391,20 +572,10 @@ class Featurizer:
         # self.conn.gsql("USE GRAPH {}\n".format(self.conn.graphname) + "DROP JOB *")
         # Create schema change job
         job_name = "add_{}_attr_{}".format(schema_type, random_string(6))
-        if not (global_change):
-            job = (
-                "USE GRAPH {}\n".format(self.conn.graphname)
-                + "CREATE SCHEMA_CHANGE JOB {} {{\n".format(job_name)
-                + "".join(tasks)
-                + "}}\nRUN SCHEMA_CHANGE JOB {}".format(job_name)
-            )
-        else:
-            job = (
-                "USE GRAPH {}\n".format(self.conn.graphname)
-                + "CREATE GLOBAL SCHEMA_CHANGE JOB {} {{\n".format(job_name)
-                + "".join(tasks)
-                + "}}\nRUN GLOBAL SCHEMA_CHANGE JOB {}".format(job_name)
-            )
+        scope = "GLOBAL " if global_change else ""
+        job = "USE GRAPH {0}\nCREATE {1}SCHEMA_CHANGE JOB {2} {{\n{3}}}\nRUN {1}SCHEMA_CHANGE JOB {2}".format(
+            self.conn.graphname, scope, job_name, "".join(tasks)
+        )
         # Submit the job
         print("Altering graph schema to save results...", flush=True)
         resp = self.conn.gsql(job)
@@ -416,19 +587,7 @@ class Featurizer:
         return "Schema change succeeded."
 
     def _get_query(self, query_name: str) -> str:
-        if not self.algo_paths:
-            self.algo_paths, self.query_result_type, self.sch_type = self._get_algo_details(self.algo_dict)
-        if query_name not in self.algo_paths:
-            raise ValueError("Cannot find {} in the library.".format(query_name))
-        query_path = self.algo_paths[query_name][-1]
-        if query_path.startswith("http"):
-            resp = requests.get(query_path)
-            resp.raise_for_status()
-            query = resp.text
-        else:
-            with open(query_path) as f:
-                query = f.read()
-        return query
+        return _read_query(self._get_algo_paths(query_name)[-1])
 
     def getParams(self, query_name: str, printout: bool = True) -> dict:
         """Get paramters for an algorithm.
@@ -442,8 +601,12 @@ class Featurizer:
         Returns:
             Parameter dict the algorithm takes as input.
         """        
-        query = self._get_query(query_name)
-        param_values, param_types = self._get_params(query)
+        if query_name not in self.params_dict:
+            self.params_dict[query_name] = self._get_params(self._get_query(query_name))
+            self._required_params[query_name] = [
+                k for k, v in self.params_dict[query_name][0].items() if v is None
+            ]
+        param_values, param_types = self.params_dict[query_name]
         if printout:
             print("Parameters for {} (parameter: type [= default value]):".format(query_name))
             for param in param_values:
@@ -454,7 +617,8 @@ class Featurizer:
                         print("- {}: {} = {}".format(param, param_types[param], param_values[param]))
                 else:
                     print("- {}: {}".format(param, param_types[param]))
-        return param_values
+        # Callers update the returned dict, so hand out a copy of the cached one.
+        return dict(param_values)
 
     def _get_params(self, query: str):
         """
@@ -467,41 +631,12 @@ class Featurizer:
         param_values = {}
         param_types = {}
         header = query[query.find("(") + 1 : query.find(")")].strip()
-        if not header:
-            return {}, {}
-        header = header.split(",")
-        for i in header:
-            param_type, param_raw = i.strip().split(maxsplit=1)
-            param_type = param_type.strip()
-            if "=" in param_raw:
-                param, default = param_raw.strip().split("=")
-                param = param.strip()
-                default = default.strip()
-            else: 
-                param, default = param_raw.strip(), None
-            
-            if (
-                param_type.lower() == "float"
-                or param_type.lower() == "double"
-            ):
-                param_values[param] = float(default) if default else None
-                param_types[param] = "float"
-            elif param_type.lower() == "int":
-                param_values[param] = int(default) if default else None
-                param_types[param] = "int"
-            elif param_type.lower() == "bool":
-                if default and default.lower() == "true":
-                    param_values[param] = True
-                elif default and default.lower() == "false":
-                    param_values[param] = False
-                else:
-                    param_values[param] = None
-                param_types[param] = "bool"
-            elif param_type.lower() == "string":
-                param_values[param] = default.strip('"').strip("'") if default else None
-                param_types[param] = "str"
+        for param_type, param, default in _PARAM_RE.findall(header):
+            if param_type.lower() in _PARAM_TYPES:
+                param_types[param], convert = _PARAM_TYPES[param_type.lower()]
+                param_values[param] = convert(default) if default else None
             else:
-                param_values[param] = default
+                param_values[param] = default or None
                 param_types[param] = param_type
 
         return param_values, param_types
@@ -533,6 +668,7 @@ class Featurizer:
                 Query parameters. A dictionary that corresponds to the algorithm parameters. 
                 If specifying vertices as sources or destinations, must use the following form:
                 `{"id": "vertex_id", "type": "vertex_type"}`, such as `params = {"source": {"id": "Bob", "type": "Person"}}`
+                NumPy values are converted to Python types and keys are sorted, so repeated calls send identical payloads.
             runAsync (bool, optional):
                 If True, runs the algorithm in asynchronous mode and returns a `AsyncFeaturizerResult` object. Defaults to False.
             threadLimit:
@@ -559,11 +695,80 @@ class Featurizer:
             The output of the query, a list of output elements (vertex sets, edge sets, variables,
             accumulators, etc.)
         """
+        params = self._prepare_algorithm(
+            query_name, params, feat_name, feat_type, custom_query, schema_name, global_schema)
+        result = self.conn.runInstalledQuery(
+            query_name, params, timeout=timeout, sizeLimit=sizeLimit, usePost=True, runAsync=runAsync, threadLimit=threadLimit)
+        if result is not None:
+            if runAsync:
+                return AsyncFeaturizerResult(self.conn, query_name, result)
+            else:
+                return result
+
+    def runAlgorithmBatch(
+        self,
+        jobs: List[tuple],
+        threadLimit: int = None,
+        global_schema: bool = False,
+        timeout: int = 2147480,
+        sizeLimit: int = None,
+        max_workers: int = 8,
+    ) -> List[Any]:
+        """
+        Runs several built-in TigerGraph Graph Data Science Algorithms concurrently.
+        Parameters are resolved, result attributes are added and missing algorithms are installed
+        one job at a time, then the queries themselves are run in parallel.
+
+        Args:
+            jobs (List[tuple]):
+                List of `(query_name, params)` or `(query_name, params, feat_name)` tuples.
+                `params` follows the same rules as in `runAlgorithm()` and may be `None`.
+            threadLimit:
+                Specify a limit of the number of threads each query is allowed to use on each node of the TigerGraph cluster.
+            global_schema (bool, optional):
+                False by default. Set to true if you want to run `GLOBAL SCHEMA_CHANGE JOB`.
+            timeout (int, optional):
+                Maximum duration for successful query execution (in milliseconds).
+            sizeLimit (int, optional):
+                Maximum size of response (in bytes).
+            max_workers (int, optional):
+                Maximum number of queries running at the same time. Defaults to 8.
+
+        Returns:
+            List of query outputs, in the same order as `jobs`.
+        """
+        # Schema changes and installs must not overlap, so preparation stays sequential.
+        prepared = []
+        for job in jobs:
+            query_name, params = job[0], job[1]
+            feat_name = job[2] if len(job) > 2 else None
+            params = self._prepare_algorithm(
+                query_name, params, feat_name, None, False, None, global_schema)
+            prepared.append((query_name, params))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.conn.runInstalledQuery, query_name, params, timeout=timeout,
+                    sizeLimit=sizeLimit, usePost=True, threadLimit=threadLimit)
+                for query_name, params in prepared
+            ]
+            return [f.result() for f in futures]
+
+    def _prepare_algorithm(
+        self,
+        query_name: str,
+        params: dict,
+        feat_name: str,
+        feat_type: str,
+        custom_query: bool,
+        schema_name: list,
+        global_schema: bool,
+    ) -> dict:
+        # Resolve parameters, add the result attribute and install the query if needed.
         if params is None:
             if not custom_query:
                 params = self.getParams(query_name, printout=False)
-            if params:
-                missing_params = [k for k,v in params.items() if v is None]
+                missing_params = self._required_params[query_name]
                 if missing_params:
                     raise ValueError(
                         'Missing mandatory parameters: {}. Please run getParams("{}") for parameter details.'.format(list(missing_params), query_name)
@@ -571,7 +776,7 @@ class Featurizer:
         else:
             if not custom_query:
                 query_params = self.getParams(query_name, printout=False)
-                unknown_params = set(params.keys()) - set(query_params.keys())
+                unknown_params = params.keys() - query_params.keys()
                 if unknown_params:
                     raise ValueError(
                         'Unknown parameters: {}. Please run getParams("{}") for required parameters.'.format(list(unknown_params), query_name)
@@ -583,26 +788,29 @@ class Featurizer:
                         'Missing mandatory parameters: {}. Please run getParams("{}") for parameter details.'.format(list(missing_params), query_name)
                     )
                 params = query_params
-            if "similarity_edge" in params.keys() or "similarity_edge_type" in params.keys():
-                if "similarity_edge" in params.keys():
-                    if params["similarity_edge"] not in self.conn.getEdgeTypes():
-                        raise ValueError("The edge type "+params["similarity_edge"]+" must be present in the graph schema with a FLOAT attribute to write to it.")
-                if "similarity_edge_type" in params.keys():
-                    if params["similarity_edge_type"] not in self.conn.getEdgeTypes():
-                        raise ValueError("The edge type "+params["similarity_edge_type"]+" must be present in the graph schema with a FLOAT attribute to write to it.")
-            if "result_attr" in params.keys() or "result_attribute" in params.keys() or feat_name:
+            edge_types = None
+            for key in ("similarity_edge", "similarity_edge_type"):
+                if key in params:
+                    if edge_types is None:
+                        edge_types = self.conn.getEdgeTypes()
+                    if params[key] not in edge_types:
+                        raise ValueError("The edge type "+params[key]+" must be present in the graph schema with a FLOAT attribute to write to it.")
+            if "result_attr" in params or "result_attribute" in params or feat_name:
                 if custom_query and not(schema_name):
                     raise ValueError("Must specify schema_name if adding attributes for custom query")
-                if "result_attr" in params.keys() and params["result_attr"]:
+                if params.get("result_attr"):
                     feat_name = params["result_attr"]
-                elif "result_attribute" in params.keys() and params["result_attribute"]:
+                elif params.get("result_attribute"):
                     feat_name = params["result_attribute"]
                 if not(query_name == "tg_fastRP" and int(self.major_ver) <= 3 and int(self.minor_ver) <= 7): # fastRP in 3.7 creates attribute at install time
                     if not(custom_query):
+                        self._load_algo_details()
                         feat_type = self.query_result_type[query_name]
                         schema_type = self.sch_type[query_name]
                     else:
-                        if schema_name[0] in self.conn.getEdgeTypes(): # assuming all schema changes are either edge types or vertex types, no mixing.
+                        if edge_types is None:
+                            edge_types = self.conn.getEdgeTypes()
+                        if schema_name[0] in edge_types: # assuming all schema changes are either edge types or vertex types, no mixing.
                             schema_type = "EDGE"
                         else:
                             schema_type = "VERTEX"
@@ -630,51 +838,44 @@ class Featurizer:
                         else:
                             raise ValueError("e_type should be either a list or string")
 
-                    global_types = []
-                    local_types = []
-                    if schema_type == "VERTEX":
-                        for v_type in schema_name:
-                            if "IsLocal" in self.conn.getVertexType(v_type, force=True):
-                                local_types.append(v_type)
-                            else:
-                                global_types.append(v_type)
-                    if schema_type == "EDGE":
-                        for e_type in schema_name:
-                            if "IsLocal" in self.conn.getEdgeType(e_type, force=True):
-                                local_types.append(e_type)
-                            else:
-                                global_types.append(e_type)
-                    if len(global_types) > 0 or global_schema:
-                        _ = self._add_attribute(
-                            schema_type=schema_type,
-                            attr_type=feat_type,
-                            attr_name=feat_name,
-                            schema_name=global_types,
-                            global_change=True,
-                        )
-                    if len(local_types) > 0 or not(global_schema):
-                        _ = self._add_attribute(
-                            schema_type = schema_type,
-                            attr_type = feat_type,
-                            attr_name = feat_name,
-                            schema_name = local_types,
-                            global_change=False,
-                        )
-            '''
-            else:
-                query_ulr = self.algo_paths[query_name][-1]
-                raise ValueError(
-                    "The algorithm does not provide any feature, see the algorithm details: "
-                    + query_ulr
-                    + "."
-                )
-            '''
-        if not(query_name in [x.split("/")[-1] for x in self.conn.getInstalledQueries().keys()]) and not(custom_query):
-            self.installAlgorithm(query_name, global_change=global_schema)
-        result = self.conn.runInstalledQuery(
-            query_name, params, timeout=timeout, sizeLimit=sizeLimit, usePost=True, runAsync=runAsync, threadLimit=threadLimit)
-        if result != None:
-            if runAsync:
-                return AsyncFeaturizerResult(self.conn, query_name, result)
+                    # Attributes already added by this featurizer need no schema round trips.
+                    added_key = (schema_type, feat_type, feat_name, tuple(schema_name or ()), global_schema)
+                    if added_key not in self._added_attrs:
+                        global_types = []
+                        local_types = []
+                        if schema_type in ("VERTEX", "EDGE"):
+                            # One schema fetch classifies every type instead of one per type.
+                            schema = self.conn.getSchema(force=True)
+                            type_key = "VertexTypes" if schema_type == "VERTEX" else "EdgeTypes"
+                            local_names = {t["Name"] for t in schema[type_key] if "IsLocal" in t}
+                            for t in schema_name:
+                                if t in local_names:
+                                    local_types.append(t)
+                                else:
+                                    global_types.append(t)
+                        if len(global_types) > 0 or global_schema:
+                            _ = self._add_attribute(
+                                schema_type=schema_type,
+                                attr_type=feat_type,
+                                attr_name=feat_name,
+                                schema_name=global_types,
+                                global_change=True,
+                            )
+                        if len(local_types) > 0 or not(global_schema):
+                            _ = self._add_attribute(
+                                schema_type = schema_type,
+                                attr_type = feat_type,
+                                attr_name = feat_name,
+                                schema_name = local_types,
+                                global_change=False,
+                            )
+                        self._added_attrs.add(added_key)
+        if not(custom_query) and query_name not in self._installed_queries:
+            suffix = "/" + query_name
+            if any(x.endswith(suffix) for x in self.conn.getInstalledQueries()):
+                self._installed_queries.add(query_name)
             else:
-                return result
+                self.installAlgorithm(query_name, global_change=global_schema)
+        if params:
+            params = _normalize_params(params)
+        return params
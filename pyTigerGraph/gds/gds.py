@@ -35,8 +35,6 @@ from .dataloaders import (EdgeLoader, EdgeNeighborLoader, GraphLoader,
                           NeighborLoader, VertexLoader)
 from .featurizer import Featurizer
 from .splitters import RandomEdgeSplitter, RandomVertexSplitter
-# from ..pyTigerGraph import pyTigerGraphGSQL
-from pyTigerGraph.pyTigerGraphGSQL import pyTigerGraphGSQL
 
 
 class GDS:
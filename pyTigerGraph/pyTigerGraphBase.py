@@ -13,6 +13,13 @@ from typing import Union
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 
@@ -152,6 +159,15 @@ class pyTigerGraphBase(object):
 
         self.Client = None
 
+        # Shared session so that REST++ requests reuse pooled keep-alive connections. Only failures
+        # to connect are retried (with backoff): a request that reached the server is never sent
+        # again, since e.g. installed queries run with GET may modify the graph
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         # TODO Remove gcp parameter
         if gcp:
             warnings.warn("The `gcp` parameter is deprecated.", DeprecationWarning)
@@ -187,8 +203,8 @@ class pyTigerGraphBase(object):
         logger.info("exit: __init__")
 
     def _locals(self, _locals: dict) -> str:
-        del _locals["self"]
-        return str(_locals)
+        # Only the caller's parameters: no `self` and no private (underscore) helper variables
+        return str({k: v for k, v in _locals.items() if k != "self" and not k.startswith("_")})
 
     def _errorCheck(self, res: dict):
         """Checks if the JSON document returned by an endpoint has contains `error: true`. If so,
@@ -266,14 +282,29 @@ class pyTigerGraphBase(object):
         else:
             verify = True
 
-        if jsonData:
-            res = requests.request(method, url, headers=_headers, json=_data, params=params, verify=verify)
+        body = None
+        if jsonData and orjson is not None and _data is not None:
+            try:
+                body = orjson.dumps(_data)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; let requests encode it
+        if body is not None:
+            _headers = dict(_headers, **{"Content-Type": "application/json"})
+            res = self._session.request(method, url, headers=_headers, data=body, params=params, verify=verify)
+        elif jsonData:
+            res = self._session.request(method, url, headers=_headers, json=_data, params=params, verify=verify)
         else:
-            res = requests.request(method, url, headers=_headers, data=_data, params=params, verify=verify)
+            res = self._session.request(method, url, headers=_headers, data=_data, params=params, verify=verify)
 
         if res.status_code != 200:
             res.raise_for_status()
-        res = json.loads(res.text, strict=strictJson)
+        if strictJson and orjson is not None:
+            try:
+                res = orjson.loads(res.content)
+            except orjson.JSONDecodeError:
+                res = json.loads(res.text)
+        else:
+            res = json.loads(res.text, strict=strictJson)
         if not skipCheck:
             self._errorCheck(res)
         if not resKey:
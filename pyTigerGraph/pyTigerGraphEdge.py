@@ -6,20 +6,116 @@ All functions in this module are called as methods on a link:https://docs.tigerg
 import json
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from urllib.parse import quote, urlencode
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 if TYPE_CHECKING:
     import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraph.pyTigerGraphQuery import pyTigerGraphQuery
 
 logger = logging.getLogger(__name__)
 
+# Edge count of all edge types of a vertex: graph URL, source vertex type and ID
+_EDGE_COUNT_URL = "{}/edges/{}/{}?count_only=true"
+
+# The deprecation warning of getEdgesDataframe() is issued only once per process
+_deprecatedGetEdgesDataframeWarned = False
+
+# Interpreted query listing all edges of a type (used by getEdgesByType)
+_EDGES_BY_TYPE_QUERY = Template(
+    'INTERPRET QUERY () FOR GRAPH $graph { \
+            SetAccum<EDGE> @@edges; \
+            start = {ANY}; \
+            res = \
+                SELECT s \
+                FROM   start:s-(:e)->ANY:t \
+                WHERE  e.type == "$edgeType" \
+                   AND s.type == "$sourceEdgeType" \
+                ACCUM  @@edges += e; \
+            PRINT @@edges AS edges; \
+        }')
+
+
+# pandas module, imported on first use so that importing pyTigerGraph does not require it
+_pd = None
+
+
+def _pandas():
+    """Returns the pandas module, importing it on the first call."""
+    global _pd
+    if _pd is None:
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("Pandas is required to use this function. "
+                              "Download pandas using 'pip install pandas'.")
+        _pd = pandas
+    return _pd
+
+
+def _brief(obj):
+    """Returns what to log for a (possibly large) return value: the shape of a DataFrame,
+    otherwise the value itself (truncated by the `%.500s` log format)."""
+    if hasattr(obj, "shape") and hasattr(obj, "columns"):
+        return "DataFrame of shape {}".format(obj.shape)
+    return obj
+
+
+def _dumps(obj) -> bytes:
+    """Serializes a request body compactly, with orjson when it is available."""
+    if orjson is not None:
+        try:
+            # Vertex IDs may be numbers; like json.dumps, turn those keys into strings
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
 class pyTigerGraphEdge(pyTigerGraphQuery):
 
+    # Edge type details by name, rebuilt whenever a different schema object is fetched
+    _edgeTypeIndex = None
+    _edgeTypeIndexSchema = None
+    # Derived edge type facts (source/target types, direction, reverse edge), same lifetime
+    _edgeMeta = None
+    _edgeMetaSchema = None
+
+    # Edge attribute statistics by (graphname, edgeType), used by getEdgeStats(useCache=True)
+    _edgeStatsCache = None
+
+    # REST++ URL of the graph and the (restppUrl, graphname) it was built from
+    _graphUrlCache = None
+    _graphUrlRestpp = None
+    _graphUrlName = None
+
+    @property
+    def _graphUrl(self) -> str:
+        """The `/graph/{graph_name}` REST++ URL, rebuilt if `restppUrl` or `graphname` changes."""
+        if self._graphUrlRestpp is not self.restppUrl or self._graphUrlName is not self.graphname:
+            self._graphUrlCache = self.restppUrl + "/graph/" + self.graphname
+            self._graphUrlRestpp = self.restppUrl
+            self._graphUrlName = self.graphname
+        return self._graphUrlCache
+
+    def _getEdgeMeta(self, edgeType: str) -> dict:
+        """Returns the memo of derived facts of an edge type, reset when the schema changes."""
+        schema = self.getSchema()
+        if self._edgeMetaSchema is not schema:
+            self._edgeMeta = {}
+            self._edgeMetaSchema = schema
+        return self._edgeMeta.setdefault(edgeType, {})
+
     def getEdgeTypes(self, force: bool = False) -> list:
         """Returns the list of edge type names of the graph.
 
@@ -32,15 +128,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The list of edge types defined in the current graph.
         """
         logger.info("entry: getEdgeTypes")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
-        ret = []
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            ret.append(et["Name"])
+        ret = [et["Name"] for et in self.getSchema(force=force)["EdgeTypes"]]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdgeTypes")
 
         return ret
@@ -59,23 +154,29 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The metadata of the edge type.
         """
         logger.info("entry: getEdgeType")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        schema = self.getSchema(force=force)
+        if self._edgeTypeIndexSchema is not schema:
+            self._edgeTypeIndex = {et["Name"]: et for et in schema["EdgeTypes"]}
+            self._edgeTypeIndexSchema = schema
 
-        for et in self.getSchema(force=force)["EdgeTypes"]:
-            if et["Name"] == edgeType:
-                if logger.level == logging.DEBUG:
-                    logger.debug("return: " + str(et))
-                logger.info("exit: getEdgeType (found)")
+        et = self._edgeTypeIndex.get(edgeType)
+        if et is not None:
+            if _dbg:
+                logger.debug("return: %.500s", _brief(et))
+            logger.info("exit: getEdgeType (found)")
 
-                return et
+            return et
 
-        logger.warning("Edge type `" + edgeType + "` was not found.")
+        logger.warning("Edge type `%s` was not found.", edgeType)
         logger.info("exit: getEdgeType (not found)")
 
         return {}
 
-    def getEdgeSourceVertexType(self, edgeType: str) -> Union[str, set]:
+    def getEdgeSourceVertexType(self, edgeType: str) -> Union[str, frozenset]:
         """Returns the type(s) of the edge type's source vertex.
 
         Args:
@@ -87,7 +188,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             - "*" if the edge can originate from any vertex type (notation used in 2.6.1 and earlier
                 versions).
                 See https://docs.tigergraph.com/v/2.6/dev/gsql-ref/ddl-and-loading/defining-a-graph-schema#creating-an-edge-from-or-to-any-vertex-type
-            - A set of vertex type name strings (unique values) if the edge has multiple source
+            - A frozenset of vertex type name strings (unique values) if the edge has multiple source
                 vertex types (notation used in 3.0 and later versions). /
                 Even if the source vertex types were defined as `"*"`, the REST API will list them as
                 pairs (i.e. not as `"*"` in 2.6.1 and earlier versions), just like as if there were
@@ -99,17 +200,29 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 valid/defined.
         """
         logger.info("entry: getEdgeSourceVertexType")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        meta = self._getEdgeMeta(edgeType)
+        if "src" in meta:
+            ret = meta["src"]
+
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
+            logger.info("exit: getEdgeSourceVertexType (cached)")
+
+            return ret
 
         edgeTypeDetails = self.getEdgeType(edgeType)
 
         # Edge type with a single source vertex type
         if edgeTypeDetails["FromVertexTypeName"] != "*":
             ret = edgeTypeDetails["FromVertexTypeName"]
+            meta["src"] = ret
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
             logger.info("exit: getEdgeSourceVertexType (single source)")
 
             return ret
@@ -117,24 +230,24 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         # Edge type with multiple source vertex types
         if "EdgePairs" in edgeTypeDetails:
             # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["From"])
+            vts = frozenset(ep["From"] for ep in edgeTypeDetails["EdgePairs"])
+            meta["src"] = vts
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(vts))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(vts))
             logger.info("exit: getEdgeSourceVertexType (multi source)")
 
             return vts
         else:
             # 2.6.1 and earlier notation
-            if logger.level == logging.DEBUG:
+            if _dbg:
                 logger.debug("return: *")
+            meta["src"] = "*"
             logger.info("exit: getEdgeSourceVertexType (multi source, pre-3.x)")
 
             return "*"
 
-    def getEdgeTargetVertexType(self, edgeType: str) -> Union[str, set]:
+    def getEdgeTargetVertexType(self, edgeType: str) -> Union[str, frozenset]:
         """Returns the type(s) of the edge type's target vertex.
 
         Args:
@@ -146,7 +259,7 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             - "*" if the edge can end in any vertex type (notation used in 2.6.1 and earlier
                 versions).
                 See https://docs.tigergraph.com/v/2.6/dev/gsql-ref/ddl-and-loading/defining-a-graph-schema#creating-an-edge-from-or-to-any-vertex-type
-            - A set of vertex type name strings (unique values) if the edge has multiple target
+            - A frozenset of vertex type name strings (unique values) if the edge has multiple target
                 vertex types (notation used in 3.0 and later versions). /
                 Even if the target vertex types were defined as "*", the REST API will list them as
                 pairs (i.e. not as "*" in 2.6.1 and earlier versions), just like as if there were
@@ -157,17 +270,29 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 the individual source/target pairs to find out which combinations are valid/defined.
         """
         logger.info("entry: getEdgeTargetVertexType")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        meta = self._getEdgeMeta(edgeType)
+        if "tgt" in meta:
+            ret = meta["tgt"]
+
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
+            logger.info("exit: getEdgeTargetVertexType (cached)")
+
+            return ret
 
         edgeTypeDetails = self.getEdgeType(edgeType)
 
         # Edge type with a single target vertex type
         if edgeTypeDetails["ToVertexTypeName"] != "*":
             ret = edgeTypeDetails["ToVertexTypeName"]
+            meta["tgt"] = ret
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
             logger.info("exit: getEdgeTargetVertexType (single target)")
 
             return ret
@@ -175,19 +300,19 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         # Edge type with multiple target vertex types
         if "EdgePairs" in edgeTypeDetails:
             # v3.0 and later notation
-            vts = set()
-            for ep in edgeTypeDetails["EdgePairs"]:
-                vts.add(ep["To"])
+            vts = frozenset(ep["To"] for ep in edgeTypeDetails["EdgePairs"])
+            meta["tgt"] = vts
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(vts))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(vts))
             logger.info("exit: getEdgeTargetVertexType (multi target)")
 
             return vts
         else:
             # 2.6.1 and earlier notation
-            if logger.level == logging.DEBUG:
+            if _dbg:
                 logger.debug("return: *")
+            meta["tgt"] = "*"
             logger.info("exit: getEdgeTargetVertexType (multi target, pre-3.x)")
 
             return "*"
@@ -203,13 +328,17 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             `True`, if the edge is directed.
         """
         logger.info("entry: isDirected")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
-        ret = self.getEdgeType(edgeType)["IsDirected"]
+        meta = self._getEdgeMeta(edgeType)
+        if "directed" not in meta:
+            meta["directed"] = self.getEdgeType(edgeType)["IsDirected"]
+        ret = meta["directed"]
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: isDirected")
 
         return ret
@@ -225,21 +354,28 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The name of the reverse edge, if it was defined.
         """
         logger.info("entry: getReverseEdge")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
-
-        if not self.isDirected(edgeType):
-            logger.error(edgeType + " is not a directed edge")
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        meta = self._getEdgeMeta(edgeType)
+        if "directed" not in meta or "reverse" not in meta:
+            # Direction and reverse edge both come from the same edge type details
+            et = self.getEdgeType(edgeType)
+            meta["directed"] = et["IsDirected"]
+            meta["reverse"] = et.get("Config", {}).get("REVERSE_EDGE", "")
+
+        if not meta["directed"]:
+            logger.error("%s is not a directed edge", edgeType)
             logger.info("exit: getReverseEdge (not directed)")
 
             return ""
 
-        config = self.getEdgeType(edgeType)["Config"]
-        if "REVERSE_EDGE" in config:
-            ret = config["REVERSE_EDGE"]
+        if meta["reverse"]:
+            ret = meta["reverse"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
             logger.info("exit: getReverseEdge (reverse edge found)")
 
             return ret
@@ -294,8 +430,9 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/tigergraph-server/current/api/built-in-endpoints#_run_built_in_functions_on_graph
         """
         logger.info("entry: getEdgeCountFrom")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         # If WHERE condition is not specified, use /builtins else user /vertices
         if where or (sourceVertexType and sourceVertexId):
@@ -303,43 +440,40 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 raise TigerGraphException(
                     "If where condition is specified, then both sourceVertexType and sourceVertexId"
                     " must be provided too.", None)
-            url = self.restppUrl + "/graph/" + self._safeChar(self.graphname) + "/edges/" + \
-                  self._safeChar(sourceVertexType) + "/" + self._safeChar(sourceVertexId)
-            if edgeType:
-                url += "/" + self._safeChar(edgeType)
-                if targetVertexType:
-                    url += "/" + self._safeChar(targetVertexType)
-                    if targetVertexId:
-                        url += "/" + self._safeChar(targetVertexId)
-            url += "?count_only=true"
-            if where:
-                url += "&filter=" + self._safeChar(where)
-            res = self._get(url)
+            if not edgeType and not where:
+                res = self._get(_EDGE_COUNT_URL.format(self._graphUrl,
+                    self._safeChar(sourceVertexType), self._safeChar(sourceVertexId)))
+            else:
+                params = {"count_only": "true"}
+                if where:
+                    params["filter"] = where
+                res = self._get(self._edgesUrl(sourceVertexType, sourceVertexId, edgeType,
+                    targetVertexType, targetVertexId, params))
         else:
             if not edgeType:  # TODO Is this a valid check?
                 raise TigerGraphException(
                     "A valid edge type or \"*\" must be specified for edge type.", None)
-            data = '{"function":"stat_edge_number","type":"' + edgeType + '"' \
-                   + (',"from_type":"' + sourceVertexType + '"' if sourceVertexType else '') \
-                   + (',"to_type":"' + targetVertexType + '"' if targetVertexType else '') \
-                   + '}'
-            res = self._post(self.restppUrl + "/builtins/" + self.graphname, data=data)
+            data = {"function": "stat_edge_number", "type": edgeType}
+            if sourceVertexType:
+                data["from_type"] = sourceVertexType
+            if targetVertexType:
+                data["to_type"] = targetVertexType
+            res = self._post(self.restppUrl + "/builtins/" + self.graphname,
+                data=_dumps(data))
 
         if len(res) == 1 and res[0]["e_type"] == edgeType:
             ret = res[0]["count"]
 
-            if logger.level == logging.DEBUG:
-                logger.debug("return: " + str(ret))
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
             logger.info("exit: getEdgeCountFrom (single edge type)")
 
             return ret
 
-        ret = {}
-        for r in res:
-            ret[r["e_type"]] = r["count"]
+        ret = {r["e_type"]: r["count"] for r in res}
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdgeCountFrom  (multiple edge types)")
 
         return ret
@@ -364,14 +498,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             A dictionary of `edge_type: edge_count` pairs.
         """
         logger.info("entry: getEdgeCount")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         ret = self.getEdgeCountFrom(edgeType=edgeType, sourceVertexType=sourceVertexType,
             targetVertexType=targetVertexType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdgeCount")
 
         return ret
@@ -421,14 +556,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             parameters and functionality.
         """
         logger.info("entry: upsertEdge")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         if attributes is None:
             attributes = {}
 
         vals = self._upsertAttrs(attributes)
-        data = json.dumps({
+        data = _dumps({
             "edges": {
                 sourceVertexType: {
                     sourceVertexId: {
@@ -442,17 +578,18 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             }
         })
 
-        ret = self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
+        ret = self._post(self._graphUrl, data=data)[0][
             "accepted_edges"]
+        self.invalidateEdgeStats()
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: upsertEdge")
 
         return ret
 
     def upsertEdges(self, sourceVertexType: str, edgeType: str, targetVertexType: str,
-            edges: list) -> int:
+            edges: list, batchSize: int = None, maxWorkers: int = 1) -> int:
         """Upserts multiple edges (of the same type).
 
         Args:
@@ -479,10 +616,18 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 ]
                 ```
                 For valid values of `<operator>` see https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#operation-codes .
+            batchSize:
+                If specified, the edges are sent in requests of at most this many edges instead of
+                a single request.
+            maxWorkers:
+                The number of batches sent concurrently when `batchSize` is specified.
 
         Returns:
             A single number of accepted (successfully upserted) edges (0 or positive integer).
 
+        Raises:
+            `TigerGraphException` if `batchSize` or `maxWorkers` is not a positive integer.
+
         Endpoint:
             - `POST /graph/{graph_name}`
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#upsert-data-to-graph
@@ -491,9 +636,40 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             parameters and functionality.
         """
         logger.info("entry: upsertEdges")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        if batchSize is not None and (not isinstance(batchSize, int) or batchSize < 1):
+            raise TigerGraphException(
+                "batchSize must be a positive integer, got {}.".format(batchSize), None)
+        if not isinstance(maxWorkers, int) or maxWorkers < 1:
+            raise TigerGraphException(
+                "maxWorkers must be a positive integer, got {}.".format(maxWorkers), None)
 
+        try:
+            if batchSize is None or len(edges) <= batchSize:
+                ret = self._upsertEdgesBatch(sourceVertexType, edgeType, targetVertexType, edges)
+            else:
+                batches = [edges[i:i + batchSize] for i in range(0, len(edges), batchSize)]
+                with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                    ret = sum(executor.map(
+                        lambda batch: self._upsertEdgesBatch(
+                            sourceVertexType, edgeType, targetVertexType, batch),
+                        batches))
+        finally:
+            # Earlier batches may have been written even if a later one failed
+            self.invalidateEdgeStats()
+
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
+        logger.info("exit: upsertEdges")
+
+        return ret
+
+    def _upsertEdgesBatch(self, sourceVertexType: str, edgeType: str, targetVertexType: str,
+            edges: list) -> int:
+        """Upserts the edges in a single request and returns the number of accepted edges."""
         data = {sourceVertexType: {}}
         l1 = data[sourceVertexType]
         for e in edges:
@@ -501,30 +677,12 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 vals = self._upsertAttrs(e[2])
             else:
                 vals = {}
-            # fromVertexId
-            if e[0] not in l1:
-                l1[e[0]] = {}
-            l2 = l1[e[0]]
-            # edgeType
-            if edgeType not in l2:
-                l2[edgeType] = {}
-            l3 = l2[edgeType]
-            # targetVertexType
-            if targetVertexType not in l3:
-                l3[targetVertexType] = {}
-            l4 = l3[targetVertexType]
-            # targetVertexId
-            l4[e[1]] = vals
-        data = json.dumps({"edges": data})
-
-        ret = self._post(self.restppUrl + "/graph/" + self.graphname, data=data)[0][
-            "accepted_edges"]
-
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
-        logger.info("exit: upsertEdges")
+            # fromVertexId -> edgeType -> targetVertexType -> targetVertexId
+            l1.setdefault(e[0], {}).setdefault(edgeType, {}).setdefault(targetVertexType, {})[e[1]] = vals
+        data = _dumps({"edges": data})
 
-        return ret
+        return self._post(self._graphUrl, data=data)[0][
+            "accepted_edges"]
 
     def upsertEdgeDataFrame(self, df: 'pd.DataFrame', sourceVertexType: str, edgeType: str,
             targetVertexType: str, from_id: str = "", to_id: str = "",
@@ -556,28 +714,52 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             The number of edges upserted.
         """
         logger.info("entry: upsertEdgeDataFrame")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
-
-        json_up = []
-
-        for index in df.index:
-            json_up.append(json.loads(df.loc[index].to_json()))
-            json_up[-1] = (
-                index if from_id is None else json_up[-1][from_id],
-                index if to_id is None else json_up[-1][to_id],
-                json_up[-1] if attributes is None
-                else {target: json_up[-1][source] for target, source in attributes.items()}
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        if attributes is not None:
+            # Only the ID and mapped attribute columns are needed; convert nothing else
+            cols = [c for c in (from_id, to_id) if c] + list(attributes.values())
+            df = df[list(dict.fromkeys(cols))]
+        # One JSON round trip for the whole frame keeps the JSON-native value conversion of
+        # `to_json()` without serializing and parsing every row separately.
+        rows = json.loads(df.to_json(orient="records"))
+        json_up = [
+            (
+                index if not from_id else row[from_id],
+                index if not to_id else row[to_id],
+                row if attributes is None
+                else {target: row[source] for target, source in attributes.items()}
             )
+            for index, row in zip(df.index, rows)
+        ]
 
         ret = self.upsertEdges(sourceVertexType, edgeType, targetVertexType, json_up)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: upsertEdgeDataFrame")
 
         return ret
 
+    def _edgesUrl(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
+            targetVertexType: str = "", targetVertexId: str = "", params: dict = None) -> str:
+        """Builds an `/edges` endpoint URL with its (percent-encoded) query string."""
+        parts = [self._graphUrl, "edges",
+            self._safeChar(sourceVertexType), self._safeChar(sourceVertexId)]
+        if edgeType:
+            parts.append(self._safeChar(edgeType))
+            if targetVertexType:
+                parts.append(self._safeChar(targetVertexType))
+                if targetVertexId:
+                    parts.append(self._safeChar(targetVertexId))
+        url = "/".join(parts)
+        if params:
+            # Encoded like _safeChar() (spaces as %20, not +) so filter expressions are unchanged
+            url += "?" + urlencode(params, quote_via=quote)
+        return url
+
     def getEdges(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
             targetVertexType: str = "", targetVertexId: str = "", select: str = "", where: str = "",
             limit: Union[int, str] = None, sort: str = "", fmt: str = "py", withId: bool = True,
@@ -630,46 +812,47 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#list-edges-of-a-vertex
         """
         logger.info("entry: getEdges")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         # TODO Change sourceVertexId to sourceVertexIds and allow passing both str and list<str> as
         #   parameter
         if not sourceVertexType or not sourceVertexId:
             raise TigerGraphException(
                 "Both source vertex type and source vertex ID must be provided.", None)
-        url = self.restppUrl + "/graph/" + self.graphname + "/edges/" + sourceVertexType + "/" + \
-              str(sourceVertexId)
-        if edgeType:
-            url += "/" + edgeType
-            if targetVertexType:
-                url += "/" + targetVertexType
-                if targetVertexId:
-                    url += "/" + str(targetVertexId)
-        isFirst = True
+        if not (edgeType or select or where or limit or sort or (timeout and timeout > 0)) \
+                and fmt == "py":
+            # Common case: all edges of a vertex, as returned by REST++
+            ret = self._get(self._edgesUrl(sourceVertexType, sourceVertexId))
+
+            if _dbg:
+                logger.debug("return: %.500s", _brief(ret))
+            logger.info("exit: getEdges (all edges)")
+
+            return ret
+
+        params = {}
         if select:
-            url += "?select=" + select
-            isFirst = False
+            params["select"] = select
         if where:
-            url += ("?" if isFirst else "&") + "filter=" + where
-            isFirst = False
+            params["filter"] = where
         if limit:
-            url += ("?" if isFirst else "&") + "limit=" + str(limit)
-            isFirst = False
+            params["limit"] = limit
         if sort:
-            url += ("?" if isFirst else "&") + "sort=" + sort
-            isFirst = False
+            params["sort"] = sort
         if timeout and timeout > 0:
-            url += ("?" if isFirst else "&") + "timeout=" + str(timeout)
-        ret = self._get(url)
+            params["timeout"] = timeout
+        ret = self._get(self._edgesUrl(sourceVertexType, sourceVertexId, edgeType,
+            targetVertexType, targetVertexId, params))
 
         if fmt == "json":
-            ret = json.dumps(ret)
+            ret = _dumps(ret).decode()
         elif fmt == "df":
             ret = self.edgeSetToDataFrame(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdges")
 
         return ret
@@ -712,14 +895,15 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             JSON or pandas DataFrame.
         """
         logger.info("entry: getEdgesDataFrame")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         ret = self.getEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
             targetVertexId, select, where, limit, sort, fmt="df", timeout=timeout)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdgesDataFrame")
 
         return ret
@@ -731,15 +915,19 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
         Use `getEdgesDataFrame()` instead.
         """
-        warnings.warn(
-            "The `getEdgesDataframe()` function is deprecated; use `getEdgesDataFrame()` instead.",
-            DeprecationWarning)
+        global _deprecatedGetEdgesDataframeWarned
+        if not _deprecatedGetEdgesDataframeWarned:
+            warnings.warn(
+                "The `getEdgesDataframe()` function is deprecated; use `getEdgesDataFrame()` instead.",
+                DeprecationWarning, stacklevel=2)
+            _deprecatedGetEdgesDataframeWarned = True
 
         return self.getEdgesDataFrame(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
             targetVertexId, select, where, limit, sort, timeout)
 
     def getEdgesByType(self, edgeType: str, fmt: str = "py", withId: bool = True,
-            withType: bool = False) -> Union[dict, str, 'pd.DataFrame']:
+            withType: bool = False,
+            chunksize: int = None) -> Union[dict, str, 'pd.DataFrame', Iterator['pd.DataFrame']]:
         """Retrieves edges of the given edge type regardless the source vertex.
 
         Args:
@@ -755,6 +943,10 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 be included in the dataframe?
             withType:
                 (When the output format is "df") should the edge type be included in the dataframe?
+            chunksize:
+                (When the output format is "df") If specified, an iterator of dataframes of at most
+                this many rows is returned instead of a single dataframe.
+                See `edgeSetToDataFrameIter()`.
 
         Returns:
             The details of the edge instances of the given edge type as dictionary, JSON or pandas
@@ -763,8 +955,9 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
         TODO Add limit parameter
         """
         logger.info("entry: getEdgesByType")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
         if not edgeType:
             logger.warning("Edge type is not specified")
@@ -774,44 +967,34 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
         sourceVertexType = self.getEdgeSourceVertexType(edgeType)
         # TODO Support edges with multiple source vertex types
-        if isinstance(sourceVertexType, set) or sourceVertexType == "*":
+        if isinstance(sourceVertexType, (set, frozenset)) or sourceVertexType == "*":
             raise TigerGraphException(
                 "Edges with multiple source vertex types are not currently supported.", None)
 
-        queryText = \
-            'INTERPRET QUERY () FOR GRAPH $graph { \
-            SetAccum<EDGE> @@edges; \
-            start = {ANY}; \
-            res = \
-                SELECT s \
-                FROM   start:s-(:e)->ANY:t \
-                WHERE  e.type == "$edgeType" \
-                   AND s.type == "$sourceEdgeType" \
-                ACCUM  @@edges += e; \
-            PRINT @@edges AS edges; \
-        }'
-
-        queryText = queryText.replace("$graph", self.graphname) \
-            .replace('$sourceEdgeType', sourceVertexType) \
-            .replace('$edgeType', edgeType)
+        queryText = _EDGES_BY_TYPE_QUERY.substitute(graph=self.graphname,
+            sourceEdgeType=sourceVertexType, edgeType=edgeType)
         ret = self.runInterpretedQuery(queryText)
 
         ret = ret[0]["edges"]
 
         if fmt == "json":
-            ret = json.dumps(ret)
+            ret = _dumps(ret).decode()
         elif fmt == "df":
-            ret = self.edgeSetToDataFrame(ret, withId, withType)
+            if chunksize is not None:
+                ret = self.edgeSetToDataFrameIter(ret, chunksize, withId, withType)
+            else:
+                ret = self.edgeSetToDataFrame(ret, withId, withType)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
-        logger.info("exit: _upsertAttrs")
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
+        logger.info("exit: getEdgesByType")
 
         return ret
 
     # TODO getEdgesDataFrameByType
 
-    def getEdgeStats(self, edgeTypes: Union[str, list], skipNA: bool = False) -> dict:
+    def getEdgeStats(self, edgeTypes: Union[str, list], skipNA: bool = False,
+            useCache: bool = False, maxWorkers: int = 1) -> dict:
         """Returns edge attribute statistics.
 
         Args:
@@ -820,6 +1003,14 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
             skipNA:
                 Skip those edges that do not have attributes or none of their attributes have
                 statistics gathered.
+            useCache:
+                If `True`, returns the statistics retrieved by a previous call where available
+                instead of querying the database again. Cached statistics are discarded when edges
+                are upserted or deleted with the edge functions of this connection; use
+                `invalidateEdgeStats()` after other changes.
+            maxWorkers:
+                The number of edge types whose statistics are requested concurrently. The default
+                (`1`) requests them one after the other.
 
         Returns:
             Attribute statistics of edges; a dictionary of dictionaries.
@@ -829,46 +1020,92 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#run-built-in-functions-on-graph
         """
         logger.info("entry: getEdgeStats")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
-        ets = []
         if edgeTypes == "*":
-            ets = self.getEdgeTypes()
+            ets = tuple(self.getEdgeTypes())
         elif isinstance(edgeTypes, str):
-            ets = [edgeTypes]
-        elif isinstance(edgeTypes, list):
-            ets = edgeTypes
+            ets = (edgeTypes,)
         else:
-            logger.warning("The `edgeTypes` parameter is invalid.")
-            logger.info("exit: getEdgeStats")
+            try:
+                ets = tuple(dict.fromkeys(edgeTypes))  # each edge type is requested only once
+            except TypeError:
+                logger.warning("The `edgeTypes` parameter is invalid.")
+                logger.info("exit: getEdgeStats")
 
-            return {}
+                return {}
 
+        if self._edgeStatsCache is None:
+            self._edgeStatsCache = {}
         ret = {}
+        # stat_edge_attr accepts a single edge type per request, and the statistics it gathers are
+        # not available to (interpreted) GSQL queries, so one request per edge type is needed.
+        toFetch = [et for et in ets
+            if not (useCache and (self.graphname, et) in self._edgeStatsCache)]
+        if maxWorkers > 1 and len(toFetch) > 1:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                fetched = dict(zip(toFetch, executor.map(self._getEdgeStat, toFetch)))
+        else:
+            fetched = {et: self._getEdgeStat(et) for et in toFetch}
         for et in ets:
-            data = '{"function":"stat_edge_attr","type":"' + et + '","from_type":"*","to_type":"*"}'
-            res = self._post(self.restppUrl + "/builtins/" + self.graphname, data=data, resKey="",
-                skipCheck=True)
-            if res["error"]:
-                if "stat_edge_attr is skip" in res["message"] or \
-                        "No valid edge for the input edge type" in res["message"]:
-                    if not skipNA:
-                        ret[et] = {}
-                else:
-                    raise TigerGraphException(res["message"],
-                        (res["code"] if "code" in res else None))
+            key = (self.graphname, et)
+            if et in fetched:
+                stats = fetched[et]
+                self._edgeStatsCache[key] = stats
+            else:
+                stats = self._edgeStatsCache[key]
+            if stats is None:
+                if not skipNA:
+                    ret[et] = {}
             else:
-                res = res["results"]
-                for r in res:
-                    ret[r["e_type"]] = r["attributes"]
+                ret.update(stats)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: getEdgeStats")
 
         return ret
 
+    def _getEdgeStat(self, edgeType: str) -> Union[dict, None]:
+        """Retrieves the attribute statistics of one edge type.
+
+        Returns:
+            A dictionary of `edge_type: attribute_statistics` pairs, or `None` if the edge type has
+            no statistics.
+        """
+        data = {"function": "stat_edge_attr", "type": edgeType, "from_type": "*", "to_type": "*"}
+        res = self._post(self.restppUrl + "/builtins/" + self.graphname, data=_dumps(data), resKey="",
+            skipCheck=True)
+        if res["error"]:
+            if "stat_edge_attr is skip" in res["message"] or \
+                    "No valid edge for the input edge type" in res["message"]:
+                return None
+            raise TigerGraphException(res["message"], res.get("code"))
+        return {r["e_type"]: r["attributes"] for r in res["results"]}
+
+    def invalidateEdgeStats(self, edgeType: str = None):
+        """Discards edge attribute statistics cached by `getEdgeStats(useCache=True)`.
+
+        The edge upsert and delete functions of this connection discard all cached statistics,
+        not only those of the edge type written, since writes also affect reverse edges.
+
+        Args:
+            edgeType:
+                The edge type whose statistics are discarded. If omitted, all cached statistics
+                are discarded.
+        """
+        logger.info("entry: invalidateEdgeStats")
+
+        if self._edgeStatsCache:
+            if edgeType:
+                self._edgeStatsCache.pop((self.graphname, edgeType), None)
+            else:
+                self._edgeStatsCache.clear()
+
+        logger.info("exit: invalidateEdgeStats")
+
     def delEdges(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
             targetVertexType: str = "", targetVertexId: str = "", where: str = "",
             limit: str = "", sort: str = "", timeout: int = 0) -> dict:
@@ -907,41 +1144,77 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
                 See https://docs.tigergraph.com/dev/restpp-api/built-in-endpoints#delete-an-edge
         """
         logger.info("entry: delEdges")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        ret = self._delEdges(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
+            targetVertexId, where, limit, sort, timeout)
+        self.invalidateEdgeStats()
+
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
+        logger.info("exit: delEdges")
+
+        return ret
 
+    def _delEdges(self, sourceVertexType: str, sourceVertexId: str, edgeType: str = "",
+            targetVertexType: str = "", targetVertexId: str = "", where: str = "",
+            limit: str = "", sort: str = "", timeout: int = 0) -> dict:
+        """Sends the request of `delEdges()` without discarding cached edge statistics."""
         if not sourceVertexType or not sourceVertexId:
             raise TigerGraphException("Both sourceVertexType and sourceVertexId must be provided.",
                 None)
 
-        url = self.restppUrl + "/graph/" + self.graphname + "/edges/" + sourceVertexType + "/" + str(
-            sourceVertexId)
-
-        if edgeType:
-            url += "/" + edgeType
-            if targetVertexType:
-                url += "/" + targetVertexType
-                if targetVertexId:
-                    url += "/" + str(targetVertexId)
-
-        isFirst = True
+        params = {}
         if where:
-            url += ("?" if isFirst else "&") + "filter=" + where
-            isFirst = False
+            params["filter"] = where
         if limit and sort:  # These two must be provided together
-            url += ("?" if isFirst else "&") + "limit=" + str(limit) + "&sort=" + sort
-            isFirst = False
+            params["limit"] = limit
+            params["sort"] = sort
         if timeout and timeout > 0:
-            url += ("?" if isFirst else "&") + "timeout=" + str(timeout)
+            params["timeout"] = timeout
+        url = self._edgesUrl(sourceVertexType, sourceVertexId, edgeType, targetVertexType,
+            targetVertexId, params)
 
-        res = self._delete(url)
-        ret = {}
-        for r in res:
-            ret[r["e_type"]] = r["deleted_edges"]
+        return {r["e_type"]: r["deleted_edges"] for r in self._delete(url)}
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
-        logger.info("exit: delEdges")
+    def delEdgesBatch(self, edgeSpecs: list, maxWorkers: int = 1) -> list:
+        """Deletes several groups of edges, optionally running the deletions concurrently.
+
+        Each group is deleted with its own REST++ request, as the endpoint deletes the edges of a
+        single source vertex; use `maxWorkers` to overlap those requests. Cached edge statistics
+        are discarded once for the whole batch.
+
+        Args:
+            edgeSpecs:
+                A list of dictionaries, each holding the keyword arguments of one `delEdges()` call,
+                e.g. `{"sourceVertexType": "Person", "sourceVertexId": "Bob", "edgeType": "likes"}`.
+            maxWorkers:
+                The number of deletions running at the same time. Default is 1 (sequential).
+
+        Returns:
+            A list with the result of each `delEdges()` call (a dictionary of `edge_type:
+            deleted_edge_count` pairs), in the order of `edgeSpecs`.
+        """
+        logger.info("entry: delEdgesBatch")
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
+
+        try:
+            if maxWorkers > 1:
+                with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                    ret = list(executor.map(lambda spec: self._delEdges(**spec), edgeSpecs))
+            else:
+                ret = [self._delEdges(**spec) for spec in edgeSpecs]
+        finally:
+            # Also after a failed deletion, as the preceding ones may have changed the graph
+            self.invalidateEdgeStats()
+
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
+        logger.info("exit: delEdgesBatch")
 
         return ret
 
@@ -1011,27 +1284,89 @@ class pyTigerGraphEdge(pyTigerGraphQuery):
 
         """
         logger.info("entry: edgeSetToDataFrame")
-        if logger.level == logging.DEBUG:
-            logger.debug("params: " + self._locals(locals()))
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            logger.debug("params: %s", self._locals(locals()))
 
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("Pandas is required to use this function. "
-                              "Download pandas using 'pip install pandas'.")
+        pd = _pandas()
 
-        df = pd.DataFrame(edgeSet)
-        cols = []
+        # Collect every column in one pass and build the DataFrame once
+        cols = {}
         if withId:
-            cols.extend([df["from_type"], df["from_id"], df["to_type"], df["to_id"]])
+            for c in ("from_type", "from_id", "to_type", "to_id"):
+                cols[c] = [e[c] for e in edgeSet]
         if withType:
-            cols.append(df["e_type"])
-        cols.append(pd.DataFrame(df["attributes"].tolist()))
-
-        ret = pd.concat(cols, axis=1)
+            cols["e_type"] = [e["e_type"] for e in edgeSet]
+        attrs = [e["attributes"] for e in edgeSet]
+        keys = list(attrs[0]) if attrs else []
+        # Common case: every edge has the same attributes (all edges have as many attributes as
+        # the first one, and all of those), so each column can be built directly
+        uniform = sum(map(len, attrs)) == len(keys) * len(attrs)
+        if uniform:
+            try:
+                attrCols = {k: [a[k] for a in attrs] for k in keys}
+            except KeyError:
+                uniform = False
+        if not uniform:
+            attrCols = {}
+            n = len(edgeSet)
+            for i, a in enumerate(attrs):
+                for k, v in a.items():
+                    if k not in attrCols:
+                        attrCols[k] = [float("nan")] * n  # missing values, as pandas fills them
+                    attrCols[k][i] = v
+        if cols.keys() & attrCols.keys():
+            # Attributes named like an ID/type column: keep both columns, as separate frames
+            ret = pd.concat([pd.DataFrame(cols), pd.DataFrame(attrCols)], axis=1)
+        else:
+            cols.update(attrCols)
+            ret = pd.DataFrame(cols)
 
-        if logger.level == logging.DEBUG:
-            logger.debug("return: " + str(ret))
+        if _dbg:
+            logger.debug("return: %.500s", _brief(ret))
         logger.info("exit: edgeSetToDataFrame")
 
         return ret
+
+    def edgeSetToDataFrameIter(self, edgeSet: list, chunksize: int = 10000, withId: bool = True,
+            withType: bool = False) -> Iterator['pd.DataFrame']:
+        """Converts an edge set to a sequence of Pandas DataFrames of at most `chunksize` rows.
+
+        Works like `edgeSetToDataFrame()`, but only one chunk of the edge set is converted at a
+        time, so large edge sets can be processed without holding the whole DataFrame in memory.
+        The row index continues from chunk to chunk.
+
+        Args:
+            edgeSet:
+                A JSON array containing an edge set in the format returned by queries.
+            chunksize:
+                The maximum number of rows of each DataFrame. Default is 10000.
+            withId:
+                Whether to include the type and primary ID of source and target vertices as a column. Default is `True`.
+            withType:
+                Whether to include edge type info as a column. Default is `False`.
+
+        Returns:
+            An iterator of pandas DataFrames.
+
+        Raises:
+            `TigerGraphException` if `chunksize` is not a positive integer.
+        """
+        logger.info("entry: edgeSetToDataFrameIter")
+
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise TigerGraphException(
+                "chunksize must be a positive integer, got {}.".format(chunksize), None)
+        ret = self._edgeSetChunks(edgeSet, chunksize, withId, withType)
+
+        logger.info("exit: edgeSetToDataFrameIter")
+
+        return ret
+
+    def _edgeSetChunks(self, edgeSet: list, chunksize: int, withId: bool,
+            withType: bool) -> Iterator['pd.DataFrame']:
+        """Yields the DataFrames of `edgeSetToDataFrameIter()`, continuing the row index."""
+        for i in range(0, len(edgeSet), chunksize):
+            df = self.edgeSetToDataFrame(edgeSet[i:i + chunksize], withId, withType)
+            df.index = range(i, i + len(df))
+            yield df
@@ -109,6 +109,19 @@ class pyTigerGraphSchema(pyTigerGraphBase):
 
         return self.schema
 
+    def clearSchemaCache(self):
+        """Discards the cached schema metadata.
+
+        The next schema lookup (e.g. `getSchema()`, `getEdgeType()`) retrieves the schema from the
+        database again, together with everything derived from it. Call this after the graph schema
+        was changed, e.g. by a schema change job.
+        """
+        logger.info("entry: clearSchemaCache")
+
+        self.schema = None
+
+        logger.info("exit: clearSchemaCache")
+
     def upsertData(self, data: Union[str, object], atomic: bool = False, ackAll: bool = False,
             newVertexOnly: bool = False, vertexMustExist: bool = False,
             updateVertexOnly: bool = False) -> dict:
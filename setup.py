@@ -61,6 +61,7 @@ setup(
     ],
     extras_require={
         "gds": ["pandas", "kafka-python", "numpy"],
+        "orjson": ["orjson"],
     },
     project_urls={
         "Bug Reports": "https://github.com/tigergraph/pyTigerGraph/issues",
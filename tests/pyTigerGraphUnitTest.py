@@ -7,43 +7,47 @@ import pyTigerGraph as pyTG
 
 class pyTigerGraphUnitTest(unittest.TestCase):
     conn = None
+    _paramsCache = None
+
+    @classmethod
+    def _loadParams(cls) -> dict:
+        """Parses `testserver.cfg` once and caches the connection parameters on the class."""
+        if cls._paramsCache is None:
+            params = {
+                "host": "http://127.0.0.1",
+                "graphname": "tests",
+                "username": "tigergraph",
+                "password": "tigergraph",
+                "gsqlSecret": "",
+                "restppPort": "9000",
+                "gsPort": "14240",
+                "gsqlVersion": "",
+                "userCert": False,
+                "certPath": None,
+                "sslPort": "443",
+                "tgCloud": False,
+                "gcp": False
+            }
+
+            path = os.path.dirname(os.path.realpath(__file__))
+            fname = os.path.join(path, "testserver.cfg")
+            if exists(fname):
+                try:
+                    with open(fname, "r") as cfg:
+                        lines = cfg.read().splitlines()
+                    pairs = (l.split("=", 1) for l in lines
+                        if l.strip() and l.strip()[0] != "#")
+                    params.update({k: (v == "True" if v in ("True", "False") else v)
+                        for k, v in pairs if v})
+                except OSError as e:
+                    print(e.strerror)
+
+            cls._paramsCache = params
+
+        return cls._paramsCache
 
     def setUp(self):
-        params = {
-            "host": "http://127.0.0.1",
-            "graphname": "tests",
-            "username": "tigergraph",
-            "password": "tigergraph",
-            "gsqlSecret": "",
-            "restppPort": "9000",
-            "gsPort": "14240",
-            "gsqlVersion": "",
-            "userCert": False,
-            "certPath": None,
-            "sslPort": "443",
-            "tgCloud": False,
-            "gcp": False
-        }
-
-        path = os.path.dirname(os.path.realpath(__file__))
-        fname = os.path.join(path, "testserver.cfg")
-        if exists(fname):
-            try:
-                cfg = open(fname, "r")
-
-                lines = cfg.readlines()
-
-                for l in lines:
-                    if l.strip()[0] != "#":
-                        ll = l.rstrip("\n").split("=")
-                        if ll[1]:
-                            if ll[1] in ["True", "False"]:
-                                params[ll[0]] = ll[1] == "True"
-                            else:
-                                params[ll[0]] = ll[1]
-
-            except OSError as e:
-                print(e.strerror)
+        params = dict(self._loadParams())
 
         self.conn = pyTG.TigerGraphConnection(host=params["host"], graphname=params["graphname"],
             username=params["username"], password=params["password"], tgCloud=params["tgCloud"],
@@ -1,12 +1,15 @@
+import asyncio
 import os
 import unittest
 from io import StringIO
 from textwrap import dedent
 from unittest import runner
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 
 from pyTigerGraph import TigerGraphConnection
-from pyTigerGraph.gds.featurizer import Featurizer
+from pyTigerGraph.gds.featurizer import Featurizer, _normalize_params
 from pyTigerGraph.gds.utilities import is_query_installed
 
 
@@ -205,6 +208,15 @@ class test_Featurizer(unittest.TestCase):
     def test02_installAlgorithm(self):
         with self.assertRaises(Exception):
             self.featurizer.installAlgorithm("someQuery")
+
+    def test03_installAlgorithms(self):
+        self.assertEqual(
+            self.featurizer.installAlgorithms(["tg_pagerank", "tg_degree_cent"]),
+            ["tg_pagerank", "tg_degree_cent"])
+
+    def test04_installAlgorithms(self):
+        with self.assertRaises(ValueError):
+            self.featurizer.installAlgorithms(["tg_pagerank", "someQuery"])
  
     def test01_runAlgorithm(self):
         params = {'v_type': 'Paper',
@@ -237,6 +249,22 @@ class test_Featurizer(unittest.TestCase):
           'sampling_constant': 1, 'random_seed': 42, 'print_accum': False,'result_attr':"embedding"}
         self.featurizer.runAlgorithm("tg_fastRP", params=params)
 
+    def test04_runAlgorithmBatch(self):
+        params = {'v_type': 'Paper',
+            'e_type': 'Cite',
+            'max_change': 0.001,
+            'max_iter': 25,
+            'damping': 0.85,
+            'top_k': 100,
+            'print_accum': True,
+            'result_attr': 'pagerank', 
+            'file_path': '',
+            'display_edges': True}
+        out = self.featurizer.runAlgorithmBatch([("tg_pagerank", params), ("tg_pagerank", dict(params, top_k=10))])
+        self.assertEqual(len(out), 2)
+        self.assertIsNotNone(out[0])
+        self.assertIsNotNone(out[1])
+
     def test06_installCustomAlgorithm(self):
         path = os.path.dirname(os.path.realpath(__file__))
         fname = os.path.join(path, "fixtures/create_query_simple.gsql")
@@ -275,6 +303,75 @@ class test_Featurizer(unittest.TestCase):
         ret = self.featurizer.runAlgorithm("tg_pagerank", params=params, runAsync=True)
         self.assertIsNotNone(ret.wait())
 
+    def test10_runAlgorithm_async_await(self):
+        params = {'v_type': 'Paper',
+            'e_type': 'Cite',
+            'max_change': 0.001,
+            'max_iter': 25,
+            'damping': 0.85,
+            'top_k': 100,
+            'print_accum': True,
+            'result_attr': 'pagerank', 
+            'file_path': '',
+            'display_edges': True}
+        ret = self.featurizer.runAlgorithm("tg_pagerank", params=params, runAsync=True)
+        self.assertIsNotNone(asyncio.run(ret.waitAsync()))
+
+        async def awaitResult():
+            return await self.featurizer.runAlgorithm("tg_pagerank", params=params, runAsync=True)
+
+        self.assertIsNotNone(asyncio.run(awaitResult()))
+
+
+
+class test_normalize_params(unittest.TestCase):
+    def test_nested_numpy_values(self):
+        params = {
+            "v_type": "Paper",
+            "source": {"id": np.int64(1), "type": "Paper"},
+            "weights": (np.float32(0.5), [np.int32(2), np.array([3, 4])]),
+            "damping": np.float64(0.85),
+            "top_k": 100
+        }
+        res = _normalize_params(params)
+        self.assertEqual(["damping", "source", "top_k", "v_type", "weights"], list(res))
+        self.assertEqual({"id": 1, "type": "Paper"}, res["source"])
+        self.assertIs(type(res["source"]["id"]), int)
+        self.assertEqual((0.5, [2, [3, 4]]), res["weights"])
+        self.assertIs(type(res["weights"][0]), float)
+        self.assertIs(type(res["weights"][1][0]), int)
+        self.assertIs(type(res["damping"]), float)
+        self.assertEqual(100, res["top_k"])
+
+
+class test_Featurizer_added_attrs(unittest.TestCase):
+    def test_repeated_result_attr(self):
+        conn = MagicMock()
+        conn.getVer.return_value = "3.7.0"
+        conn.getInstalledQueries.return_value = {"GET /query/Cora/tg_pagerank": {}}
+        conn.getSchema.return_value = {"VertexTypes": [{"Name": "Paper"}], "EdgeTypes": []}
+        path = os.path.dirname(os.path.realpath(__file__))
+        featurizer = Featurizer(conn, repo=os.path.join(path, "fixtures"), algo_version="3.7")
+        featurizer._get_query = lambda name: dedent("""\
+            CREATE QUERY tg_pagerank(STRING v_type, STRING e_type, FLOAT max_change=0.001,
+              INT max_iter=25, FLOAT damping=0.85, INT top_k=100, BOOL print_accum=TRUE,
+              STRING result_attr="", STRING file_path="", BOOL display_edges=FALSE) {
+            }""")
+        featurizer._add_attribute = MagicMock()
+        params = {"v_type": "Paper", "e_type": "Cite", "result_attr": "pagerank"}
+
+        featurizer.runAlgorithm("tg_pagerank", params=params)
+        self.assertEqual(1, conn.getSchema.call_count)
+        self.assertEqual(2, featurizer._add_attribute.call_count)
+
+        # Same result attribute again: no schema fetch and no attribute changes
+        featurizer.runAlgorithm("tg_pagerank", params=params)
+        self.assertEqual(1, conn.getSchema.call_count)
+        self.assertEqual(2, featurizer._add_attribute.call_count)
+
+        featurizer.runAlgorithm("tg_pagerank", params=dict(params, result_attr="pagerank2"))
+        self.assertEqual(2, conn.getSchema.call_count)
+        self.assertEqual(4, featurizer._add_attribute.call_count)
 
 
 if __name__ == '__main__':
@@ -296,13 +393,19 @@ if __name__ == '__main__':
     suite.addTest(test_Featurizer("test05_add_attribute"))
     suite.addTest(test_Featurizer("test01_installAlgorithm"))
     suite.addTest(test_Featurizer("test02_installAlgorithm"))
+    suite.addTest(test_Featurizer("test03_installAlgorithms"))
+    suite.addTest(test_Featurizer("test04_installAlgorithms"))
     suite.addTest(test_Featurizer("test01_runAlgorithm"))
     suite.addTest(test_Featurizer("test02_runAlgorithm"))
     suite.addTest(test_Featurizer("test03_runAlgorithm")) 
+    suite.addTest(test_Featurizer("test04_runAlgorithmBatch"))
     suite.addTest(test_Featurizer("test06_installCustomAlgorithm"))
     suite.addTest(test_Featurizer("test07_runCustomAlgorithm"))
     suite.addTest(test_Featurizer("test08_runAlgorithm_async_qid"))
     suite.addTest(test_Featurizer("test09_runAlgorithm_async_wait"))
+    suite.addTest(test_Featurizer("test10_runAlgorithm_async_await"))
+    suite.addTest(test_normalize_params("test_nested_numpy_values"))
+    suite.addTest(test_Featurizer_added_attrs("test_repeated_result_attr"))
     
     runner = unittest.TextTestRunner(verbosity=2, failfast=True)
     runner.run(suite)
@@ -1,8 +1,11 @@
 import json
 import unittest
+from unittest.mock import patch
 
 import pandas
+from pandas.api.types import is_float_dtype, is_integer_dtype, is_string_dtype
 
+from pyTigerGraph.pyTigerGraphException import TigerGraphException
 from pyTigerGraphUnitTest import pyTigerGraphUnitTest
 
 
@@ -100,6 +103,45 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIsInstance(res, str)
         self.assertEqual("edge3_directed_with_reverse_reverse_edge", res)
 
+    def test_06_schemaCache(self):
+        def schema(fromType, toType, directed, reverse):
+            return {"VertexTypes": [], "EdgeTypes": [{"Name": "edge_x",
+                "FromVertexTypeName": fromType, "ToVertexTypeName": toType,
+                "IsDirected": directed, "Config": {"REVERSE_EDGE": reverse} if reverse else {},
+                "Attributes": []}]}
+
+        current = [schema("vertex1", "vertex2", True, "edge_x_reverse")]
+        self.conn.clearSchemaCache()
+        with patch.object(self.conn, "_get", side_effect=lambda *args, **kwargs: current[0]) \
+                as mockGet, patch.object(self.conn, "_getUDTs", return_value=[]):
+            def check(fromType, toType, directed, reverse):
+                self.assertEqual(fromType, self.conn.getEdgeSourceVertexType("edge_x"))
+                self.assertEqual(toType, self.conn.getEdgeTargetVertexType("edge_x"))
+                self.assertEqual(directed, self.conn.isDirected("edge_x"))
+                self.assertEqual(reverse, self.conn.getReverseEdge("edge_x"))
+
+            check("vertex1", "vertex2", True, "edge_x_reverse")
+            self.assertEqual(1, mockGet.call_count)
+            # Served from the memo, even if the database schema changed meanwhile
+            current[0] = schema("vertex3", "vertex4", False, "")
+            check("vertex1", "vertex2", True, "edge_x_reverse")
+            self.assertIs(self.conn.getEdgeType("edge_x"), self.conn.getEdgeType("edge_x"))
+            self.assertEqual(1, mockGet.call_count)
+
+            # A forced schema refresh is reflected by all lookups
+            self.conn.getSchema(force=True)
+            self.assertEqual(2, mockGet.call_count)
+            check("vertex3", "vertex4", False, "")
+            self.assertEqual(2, mockGet.call_count)
+
+            # So is clearing the schema cache
+            current[0] = schema("vertex5", "vertex6", True, "edge_x_rev")
+            self.conn.clearSchemaCache()
+            check("vertex5", "vertex6", True, "edge_x_rev")
+            self.assertEqual(3, mockGet.call_count)
+
+        self.conn.clearSchemaCache()
+
     def test_07_getEdgeCountFrom(self):
         res = self.conn.getEdgeCountFrom(edgeType="*")
         self.assertIsInstance(res, dict)
@@ -215,9 +257,49 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIsInstance(res, int)
         self.assertEqual(14, res)
 
+        # Upserting the same edges again in batches must not create new ones
+        res = self.conn.upsertEdges("vertex6", "edge4_many_to_many", "vertex7", es, batchSize=3,
+            maxWorkers=2)
+        self.assertEqual(4, res)
+
+        res = self.conn.getEdgeCount("edge4_many_to_many")
+        self.assertEqual(14, res)
+
+        with patch.object(self.conn, "_post") as mockPost:
+            for kwargs in [{"batchSize": 0}, {"batchSize": -1}, {"batchSize": 2, "maxWorkers": 0},
+                    {"maxWorkers": -1}]:
+                with self.assertRaises(TigerGraphException):
+                    self.conn.upsertEdges("vertex6", "edge4_many_to_many", "vertex7", es,
+                        **kwargs)
+            mockPost.assert_not_called()
+
     def test_11_upsertEdgeDataFrame(self):
-        # TODO Implement
-        pass
+        df = pandas.DataFrame({
+            "src": [1, 2],
+            "weight": [1.5, float("nan")],
+            "ts": [pandas.Timestamp("2022-01-01"), pandas.Timestamp("2022-01-02")],
+            "unused": ["x", "y"]
+        }, index=[10, 11])
+
+        with patch.object(self.conn, "upsertEdges", return_value=2) as upsertEdges:
+            # Target IDs taken from the index, attributes mapped and projected
+            res = self.conn.upsertEdgeDataFrame(df, "vertex6", "edge4_many_to_many", "vertex7",
+                from_id="src", attributes={"a01": "weight", "a02": "ts"})
+            self.assertEqual(2, res)
+            args = upsertEdges.call_args[0]
+            self.assertEqual(("vertex6", "edge4_many_to_many", "vertex7"), args[:3])
+            self.assertEqual([
+                (1, 10, {"a01": 1.5, "a02": 1640995200000}),
+                (2, 11, {"a01": None, "a02": 1641081600000})
+            ], args[3])
+
+            # Source IDs taken from the index, all columns as attributes
+            self.conn.upsertEdgeDataFrame(df, "vertex6", "edge4_many_to_many", "vertex7",
+                to_id="src")
+            self.assertEqual([
+                (10, 1, {"src": 1, "weight": 1.5, "ts": 1640995200000, "unused": "x"}),
+                (11, 2, {"src": 2, "weight": None, "ts": 1641081600000, "unused": "y"})
+            ], upsertEdges.call_args[0][3])
 
     def test_12_getEdges(self):
         res = self.conn.getEdges("vertex4", 1)
@@ -264,6 +346,14 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIsInstance(res, list)
         self.assertEqual(8, len(res))
 
+        df = self.conn.getEdgesByType("edge1_undirected", fmt="df")
+        res = list(self.conn.getEdgesByType("edge1_undirected", fmt="df", chunksize=3))
+        self.assertEqual([3, 3, 2], [len(c) for c in res])
+        self.assertTrue(df.equals(pandas.concat(res)))
+
+        with self.assertRaises(TigerGraphException):
+            self.conn.getEdgesByType("edge1_undirected", fmt="df", chunksize=0)
+
     def test_15_getEdgesDataFrameByType(self):
         pass
 
@@ -294,11 +384,67 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIn("edge2_directed", res)
         self.assertNotIn("edge6_loop", res)
 
+        res2 = self.conn.getEdgeStats(["edge1_undirected", "edge2_directed", "edge6_loop"],
+            skipNA=True, maxWorkers=3)
+        self.assertEqual(res, res2)
+
         res = self.conn.getEdgeStats("*", skipNA=True)
         self.assertIsInstance(res, dict)
         self.assertIn("edge3_directed_with_reverse", res)
         self.assertNotIn("edge4_many_to_many", res)
 
+    def test_16_getEdgeStats_cache(self):
+        def post(url, data=None, **kwargs):
+            if "stat_edge_attr" in str(data):
+                return {"error": False, "message": "", "results": [
+                    {"e_type": json.loads(data)["type"], "attributes": {"a01": {"MAX": 2}}}]}
+            return [{"accepted_edges": 1}]
+
+        self.conn.invalidateEdgeStats()
+        with patch.object(self.conn, "_post", side_effect=post) as mockPost, \
+                patch.object(self.conn, "_delete",
+                    return_value=[{"e_type": "edge1_undirected", "deleted_edges": 1}]):
+            def statCalls():
+                return sum("stat_edge_attr" in str(c.kwargs.get("data"))
+                    for c in mockPost.call_args_list)
+
+            res = self.conn.getEdgeStats("edge1_undirected", useCache=True)
+            self.assertEqual({"edge1_undirected": {"a01": {"MAX": 2}}}, res)
+            self.assertEqual(1, statCalls())
+
+            # Served from the cache
+            self.assertEqual(res, self.conn.getEdgeStats("edge1_undirected", useCache=True))
+            self.assertEqual(1, statCalls())
+
+            # Not using the cache always queries the database
+            self.assertEqual(res, self.conn.getEdgeStats("edge1_undirected"))
+            self.assertEqual(2, statCalls())
+
+            # Writes through the edge functions discard the cached statistics
+            writes = [
+                lambda: self.conn.upsertEdge("vertex4", 1, "edge1_undirected", "vertex5", 1),
+                lambda: self.conn.upsertEdges("vertex4", "edge1_undirected", "vertex5", [(1, 1)]),
+                lambda: self.conn.delEdges("vertex4", 1, "edge1_undirected"),
+                lambda: self.conn.invalidateEdgeStats("edge1_undirected")
+            ]
+            for i, write in enumerate(writes):
+                write()
+                self.assertEqual(res, self.conn.getEdgeStats("edge1_undirected", useCache=True))
+                self.assertEqual(3 + i, statCalls())
+                self.assertEqual(res, self.conn.getEdgeStats("edge1_undirected", useCache=True))
+                self.assertEqual(3 + i, statCalls())
+
+            # Also when a later batch fails after earlier ones were upserted
+            with patch.object(self.conn, "_upsertEdgesBatch",
+                    side_effect=[1, TigerGraphException("Upsert failed", None)]):
+                with self.assertRaises(TigerGraphException):
+                    self.conn.upsertEdges("vertex4", "edge1_undirected", "vertex5",
+                        [(1, 1), (2, 2)], batchSize=1)
+            self.assertEqual(res, self.conn.getEdgeStats("edge1_undirected", useCache=True))
+            self.assertEqual(3 + len(writes), statCalls())
+
+        self.conn.invalidateEdgeStats()
+
     def test_17_delEdges(self):
         res = self.conn.delEdges("vertex6", 1)
         self.assertIsInstance(res, dict)
@@ -330,8 +476,106 @@ class test_pyTigerGraphEdge(pyTigerGraphUnitTest):
         self.assertIn("edge4_many_to_many", res)
         self.assertEqual(3, res["edge4_many_to_many"])
 
+        # Both source vertices have no edge4_many_to_many edges left at this point
+        res = self.conn.upsertEdges("vertex6", "edge4_many_to_many", "vertex7",
+            [(6, 1), (6, 2), (2, 3)])
+        self.assertEqual(3, res)
+        count = self.conn.getEdgeCount("edge4_many_to_many")
+
+        with patch.object(self.conn, "invalidateEdgeStats",
+                wraps=self.conn.invalidateEdgeStats) as invalidateEdgeStats:
+            res = self.conn.delEdgesBatch([
+                {"sourceVertexType": "vertex6", "sourceVertexId": 6,
+                    "edgeType": "edge4_many_to_many"},
+                {"sourceVertexType": "vertex6", "sourceVertexId": 2,
+                    "edgeType": "edge4_many_to_many", "targetVertexType": "vertex7"}
+            ], maxWorkers=2)
+            self.assertEqual(1, invalidateEdgeStats.call_count)
+        self.assertIsInstance(res, list)
+        self.assertEqual([{"edge4_many_to_many": 2}, {"edge4_many_to_many": 1}], res)
+        self.assertEqual(count - 3, self.conn.getEdgeCount("edge4_many_to_many"))
+
     def test_18_edgeSetToDataFrame(self):
-        pass
+        def edge(i: int, attributes: dict) -> dict:
+            return {"e_type": "edge1_undirected", "from_type": "vertex4", "from_id": str(i),
+                "to_type": "vertex5", "to_id": str(i + 1), "directed": False,
+                "attributes": attributes}
+
+        idCols = ["from_type", "from_id", "to_type", "to_id"]
+
+        # Uniform attributes
+        res = self.conn.edgeSetToDataFrame([edge(0, {"a01": 1, "a02": "x"}),
+            edge(1, {"a01": 2, "a02": "y"})])
+        self.assertEqual(idCols + ["a01", "a02"], list(res.columns))
+        self.assertEqual(["0", "1"], list(res["from_id"]))
+        self.assertEqual(["1", "2"], list(res["to_id"]))
+        self.assertEqual([1, 2], list(res["a01"]))
+        self.assertTrue(is_integer_dtype(res["a01"]))
+        self.assertTrue(is_string_dtype(res["a02"]))
+
+        # Same attributes in a different order; columns follow the first edge
+        res = self.conn.edgeSetToDataFrame([edge(0, {"a01": 1, "a02": "x"}),
+            edge(1, {"a02": "y", "a01": 2})], withId=False, withType=True)
+        self.assertEqual(["e_type", "a01", "a02"], list(res.columns))
+        self.assertEqual([1, 2], list(res["a01"]))
+        self.assertEqual(["x", "y"], list(res["a02"]))
+
+        # Later edge with more attributes than the first one
+        res = self.conn.edgeSetToDataFrame([edge(0, {"a01": 1.5}),
+            edge(1, {"a01": 2.5, "a02": 3})])
+        self.assertEqual(idCols + ["a01", "a02"], list(res.columns))
+        self.assertEqual([1.5, 2.5], list(res["a01"]))
+        self.assertTrue(is_float_dtype(res["a02"]))
+        self.assertTrue(pandas.isna(res["a02"][0]))
+        self.assertEqual(3, res["a02"][1])
+
+        # Same number of attributes, but different ones
+        res = self.conn.edgeSetToDataFrame([edge(0, {"a01": 1, "a02": 1.5}),
+            edge(1, {"a01": 2, "a03": "z"})])
+        self.assertEqual(idCols + ["a01", "a02", "a03"], list(res.columns))
+        self.assertTrue(is_integer_dtype(res["a01"]))
+        self.assertTrue(is_float_dtype(res["a02"]))
+        self.assertEqual(1.5, res["a02"][0])
+        self.assertTrue(pandas.isna(res["a02"][1]))
+        self.assertTrue(pandas.isna(res["a03"][0]))
+        self.assertEqual("z", res["a03"][1])
+
+        # Empty edge set
+        res = self.conn.edgeSetToDataFrame([])
+        self.assertEqual(idCols, list(res.columns))
+        self.assertEqual(0, len(res))
+        res = self.conn.edgeSetToDataFrame([], withId=False)
+        self.assertEqual([], list(res.columns))
+        self.assertEqual(0, len(res))
+
+        # Attributes named like ID/type columns do not replace them
+        res = self.conn.edgeSetToDataFrame([edge(0, {"to_id": "t", "a01": 1}),
+            edge(1, {"to_id": "u", "a01": 2})], withType=True)
+        self.assertEqual(idCols + ["e_type", "to_id", "a01"], list(res.columns))
+        self.assertEqual([["1", "t"], ["2", "u"]], res["to_id"].values.tolist())
+        self.assertEqual(["edge1_undirected"] * 2, list(res["e_type"]))
+        self.assertEqual([1, 2], list(res["a01"]))
+
+    def test_19_edgeSetToDataFrameIter(self):
+        es = [{"e_type": "edge1_undirected", "from_type": "vertex4", "from_id": str(i),
+            "to_type": "vertex5", "to_id": str(i + 1), "directed": False,
+            "attributes": {"a01": i}} for i in range(7)]
+
+        for chunksize, sizes in [(1, [1] * 7), (3, [3, 3, 1]), (7, [7]), (10, [7])]:
+            res = list(self.conn.edgeSetToDataFrameIter(es, chunksize))
+            self.assertEqual(sizes, [len(df) for df in res])
+            self.assertEqual(list(range(7)), [i for df in res for i in df.index])
+            self.assertTrue(self.conn.edgeSetToDataFrame(es).equals(pandas.concat(res)))
+
+        res = list(self.conn.edgeSetToDataFrameIter(es, 4, withId=False, withType=True))
+        self.assertEqual(["e_type", "a01"], list(res[1].columns))
+        self.assertEqual([4, 5, 6], list(res[1]["a01"]))
+
+        self.assertEqual([], list(self.conn.edgeSetToDataFrameIter([], 3)))
+
+        for chunksize in [0, -1, None]:
+            with self.assertRaises(TigerGraphException):
+                self.conn.edgeSetToDataFrameIter(es, chunksize)
 
 
 if __name__ == '__main__':
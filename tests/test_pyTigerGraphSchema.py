@@ -364,6 +364,15 @@ class test_pyTigerGraphSchema(pyTigerGraphUnitTest):
         res = self.conn.getEndpoints(dynamic=True)
         self.assertEqual(4, len(res))
 
+    def test_06_clearSchemaCache(self):
+        res = self.conn.getSchema()
+        self.conn.clearSchemaCache()
+        self.assertIsNone(self.conn.schema)
+
+        res2 = self.conn.getSchema()
+        self.assertIsNot(res, res2)
+        self.assertEqual(res["GraphName"], res2["GraphName"])
+
 
 if __name__ == '__main__':
     unittest.main()